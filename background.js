@@ -1,12 +1,35 @@
 // YouTube Topic Feed Extension - Service Worker v7.7.0
 // Fixed for Manifest V3 compatibility
 
+importScripts('view-count-parser.js', 'content-classifier.js', 'search-parser.js', 'feed-fetcher.js', 'profile-store.js');
+
+const REFRESH_CONFIG = {
+    ALARM_NAME: 'topicFeedRefresh',
+    PERIOD_MINUTES: 10,
+    JITTER_MINUTES: 3,
+    IDLE_THRESHOLD_SECONDS: 60,
+    MAX_TOPICS_PER_RUN: 8,
+    PREWARM_SHARE: 0.25,
+    REQUEST_BUDGET: 30,
+    BUDGET_WINDOW: 60 * 60 * 1000,
+    REQUEST_SPACING: 1500,
+    REQUEST_JITTER: 2500,
+    CACHE_MAX_AGE: 24 * 60 * 60 * 1000
+};
+
+let refreshInProgress = false;
+let topicUsageQueue = Promise.resolve();
+
 chrome.runtime.onInstalled.addListener((details) => {
     console.log('YouTube Topic Feed Extension installed');
-    
-    // Initialize storage with empty topics array
-    chrome.storage.local.set({ topics: [] });
-    
+
+    // Initialize storage with the default profile, or wrap an existing
+    // install's topics in it, and keep `topics` mirroring the active profile
+    ProfileStore.load()
+        .then(({ profiles, activeProfile }) => ProfileStore.save(profiles, activeProfile))
+        .catch(error => console.error('Failed to initialize profiles:', error));
+    scheduleNextRefresh();
+
     // Optional: Log installation reason
     if (details.reason === 'install') {
         console.log('Extension installed for the first time');
@@ -18,6 +41,7 @@ chrome.runtime.onInstalled.addListener((details) => {
 // Handle extension startup
 chrome.runtime.onStartup.addListener(() => {
     console.log('YouTube Topic Feed Extension started');
+    scheduleNextRefresh();
 });
 
 // Optional: Handle messages from content script or popup
@@ -25,7 +49,185 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
     if (message.type === 'getVersion') {
         sendResponse({ version: chrome.runtime.getManifest().version });
     }
-    
+
+    if (message.type === 'topicsViewed') {
+        recordTopicUsage(message.topics)
+            .then(() => sendResponse({ ok: true }))
+            .catch(error => {
+                console.warn('Failed to record topic usage:', error);
+                sendResponse({ ok: false });
+            });
+    }
+
     // Return true to indicate async response (good practice)
     return true;
 });
+
+// Idle-time refresh: warm the shared topic cache while the user is away so
+// an opened YouTube tab can render straight from storage.
+chrome.alarms.onAlarm.addListener((alarm) => {
+    if (alarm.name === REFRESH_CONFIG.ALARM_NAME) {
+        scheduleNextRefresh();
+        refreshWhenIdle('alarm');
+    }
+});
+
+chrome.idle.setDetectionInterval(REFRESH_CONFIG.IDLE_THRESHOLD_SECONDS);
+chrome.idle.onStateChanged.addListener((state) => {
+    if (state === 'idle') {
+        refreshWhenIdle('idle');
+    }
+});
+
+// One-shot alarms rescheduled each run, so every install drifts apart
+function scheduleNextRefresh() {
+    const delayMinutes = REFRESH_CONFIG.PERIOD_MINUTES + Math.random() * REFRESH_CONFIG.JITTER_MINUTES;
+    chrome.alarms.create(REFRESH_CONFIG.ALARM_NAME, { delayInMinutes: delayMinutes });
+}
+
+async function refreshWhenIdle(reason) {
+    try {
+        const state = await chrome.idle.queryState(REFRESH_CONFIG.IDLE_THRESHOLD_SECONDS);
+        if (state === 'active') {
+            return;
+        }
+
+        const { lastBackgroundRefresh = 0 } = await chrome.storage.local.get('lastBackgroundRefresh');
+        if (Date.now() - lastBackgroundRefresh < REFRESH_CONFIG.PERIOD_MINUTES * 60 * 1000) {
+            return;
+        }
+
+        await refreshTopTopics(reason);
+    } catch (error) {
+        console.error('Background refresh failed:', error);
+    }
+}
+
+async function refreshTopTopics(reason) {
+    if (refreshInProgress) return;
+    refreshInProgress = true;
+
+    try {
+        await chrome.storage.local.set({ lastBackgroundRefresh: Date.now() });
+
+        const topics = await getRefreshCandidates();
+        let refreshed = 0;
+
+        for (const topic of topics) {
+            if (await FeedFetcher.isCircuitOpen()) {
+                console.log('Background refresh stopped: circuit breaker is open');
+                break;
+            }
+            if (!(await takeRequestBudget())) {
+                console.log('Background refresh stopped: request budget exhausted');
+                break;
+            }
+
+            try {
+                await FeedFetcher.fetchTopic(topic, html => SearchResultsParser.parseVideoDataWithViews(html, topic), { force: true, maxAttempts: 1 });
+                refreshed++;
+            } catch (error) {
+                console.warn(`Background refresh failed for topic ${topic}:`, error);
+            }
+
+            await sleep(REFRESH_CONFIG.REQUEST_SPACING + Math.random() * REFRESH_CONFIG.REQUEST_JITTER);
+        }
+
+        const pruned = await FeedFetcher.pruneEntries(REFRESH_CONFIG.CACHE_MAX_AGE);
+        console.log('Background refresh completed', { reason, refreshed, candidates: topics.length, pruned });
+    } finally {
+        refreshInProgress = false;
+    }
+}
+
+// Fetch plan for one run: the active profile's most-used topics, then the
+// profile the user most often switches to next, so that switch can render
+// from cache. Cache entries are keyed by topic alone, so a topic shared by
+// both profiles is planned once.
+async function getRefreshCandidates() {
+    const { topicUsage = {} } = await chrome.storage.local.get('topicUsage');
+    const { profiles, activeProfile } = await ProfileStore.load();
+    const nextProfile = await ProfileStore.predictNext(profiles, activeProfile);
+    const now = Date.now();
+
+    const prewarmSlots = nextProfile ? Math.ceil(REFRESH_CONFIG.MAX_TOPICS_PER_RUN * REFRESH_CONFIG.PREWARM_SHARE) : 0;
+    const planned = new Set();
+    const candidates = [];
+
+    const plan = async (topics, limit) => {
+        for (const topic of rankTopics(topics, topicUsage, now)) {
+            if (candidates.length >= limit) break;
+            if (planned.has(topic)) continue;
+            planned.add(topic);
+
+            const entry = await FeedFetcher.readEntry(topic);
+            if (!entry || now - entry.fetchedAt > FeedFetcher.FRESH_DURATION / 2) {
+                candidates.push(topic);
+            }
+        }
+    };
+
+    await plan(profiles[activeProfile].topics || [], REFRESH_CONFIG.MAX_TOPICS_PER_RUN - prewarmSlots);
+    if (nextProfile) {
+        await plan(profiles[nextProfile].topics || [], REFRESH_CONFIG.MAX_TOPICS_PER_RUN);
+    }
+    // Slots the next profile did not need go back to the active one
+    await plan(profiles[activeProfile].topics || [], REFRESH_CONFIG.MAX_TOPICS_PER_RUN);
+
+    return candidates;
+}
+
+function rankTopics(topics, topicUsage, now) {
+    return topics
+        .filter(topic => typeof topic === 'string')
+        .map(topic => {
+            const usage = topicUsage[topic] || { count: 0, lastUsed: 0 };
+            const ageDays = (now - usage.lastUsed) / (24 * 60 * 60 * 1000);
+            return { topic, score: usage.count / (1 + ageDays) };
+        })
+        .sort((a, b) => b.score - a.score)
+        .map(({ topic }) => topic);
+}
+
+// Every open tab reports usage; chain the read-modify-write updates so
+// concurrent reports do not overwrite each other's counts
+function recordTopicUsage(topics) {
+    if (!Array.isArray(topics) || topics.length === 0) return Promise.resolve();
+
+    const update = topicUsageQueue.then(() => applyTopicUsage(topics));
+    topicUsageQueue = update.catch(() => {});
+    return update;
+}
+
+async function applyTopicUsage(topics) {
+    const { topicUsage = {} } = await chrome.storage.local.get('topicUsage');
+    const now = Date.now();
+    for (const topic of topics) {
+        const usage = topicUsage[topic] || { count: 0, lastUsed: 0 };
+        topicUsage[topic] = { count: usage.count + 1, lastUsed: now };
+    }
+    await chrome.storage.local.set({ topicUsage });
+}
+
+// Global budget shared by every refresh run, persisted because the worker
+// can be torn down between alarms
+async function takeRequestBudget() {
+    const { refreshBudget } = await chrome.storage.local.get('refreshBudget');
+    const now = Date.now();
+    let budget = refreshBudget;
+
+    if (!budget || now - budget.windowStart >= REFRESH_CONFIG.BUDGET_WINDOW) {
+        budget = { windowStart: now, used: 0 };
+    }
+    if (budget.used >= REFRESH_CONFIG.REQUEST_BUDGET) {
+        return false;
+    }
+
+    budget.used++;
+    await chrome.storage.local.set({ refreshBudget: budget });
+    return true;
+}
+
+function sleep(ms) {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
@@ -0,0 +1,67 @@
+/**
+ * YouTube Topic Feed Pro - Content Classifier
+ * Labels search results as regular, short, live or premiere in a single pass
+ * over parsed renderer data, and filters them by user-selected content types.
+ * Shared by the content script and the background worker.
+ */
+
+const ContentClassifier = {
+    TYPES: ['regular', 'short', 'live', 'premiere'],
+    CODES: { regular: 0, short: 1, live: 2, premiere: 3 },
+    DEFAULT_CONTENT_TYPES: { regular: true, short: false, live: true, premiere: true },
+
+    // Content type name of one videoRenderer from ytInitialData
+    classifyRenderer(renderer) {
+        const endpoint = renderer.navigationEndpoint;
+        const url = endpoint?.commandMetadata?.webCommandMetadata?.url || '';
+        let overlayStyle = null;
+
+        for (const overlay of renderer.thumbnailOverlays || []) {
+            const style = overlay.thumbnailOverlayTimeStatusRenderer?.style;
+            if (style) {
+                overlayStyle = style;
+                break;
+            }
+        }
+
+        if (overlayStyle === 'SHORTS' || endpoint?.reelWatchEndpoint || url.startsWith('/shorts/')) {
+            return 'short';
+        }
+        if (renderer.upcomingEventData || overlayStyle === 'UPCOMING') {
+            return 'premiere';
+        }
+        if (overlayStyle === 'LIVE' || renderer.badges?.some(badge =>
+            badge.metadataBadgeRenderer?.style === 'BADGE_STYLE_TYPE_LIVE_NOW')) {
+            return 'live';
+        }
+        return 'regular';
+    },
+
+    // Regex fallback: collect every Shorts video ID with one scan of the
+    // document instead of several whole-document regexes per ID
+    findShortIds(html) {
+        const ids = new Set();
+        const pattern = /\/shorts\/([\w-]{11})|"reelWatchEndpoint":\{"videoId":"([\w-]{11})"|"videoId":"([\w-]{11})"(?=[^}]*(?:"isShort":true|"verticalVideo":true|"shorts"))/g;
+        for (const match of html.matchAll(pattern)) {
+            ids.add(match[1] || match[2] || match[3]);
+        }
+        return ids;
+    },
+
+    // Bitset of allowed type codes from the stored { type: boolean } settings
+    allowedMask(contentTypes) {
+        const settings = { ...this.DEFAULT_CONTENT_TYPES, ...contentTypes };
+        let mask = 0;
+        for (const type of this.TYPES) {
+            if (settings[type]) mask |= 1 << this.CODES[type];
+        }
+        return mask;
+    },
+
+    // Videos cached before classification existed have no label; they were
+    // parsed with Shorts already removed, so they count as regular
+    isAllowed(video, mask) {
+        const code = this.CODES[video.contentType] ?? this.CODES.regular;
+        return (mask & (1 << code)) !== 0;
+    }
+};
@@ -11,12 +11,21 @@
     const CONFIG = {
         MAX_RETRIES: 3,
         RETRY_DELAY: 1000,
-        MAX_VIDEOS_PER_TOPIC: 100,
         CACHE_DURATION: 15 * 60 * 1000,
         GENERATION_THROTTLE: 3000,
-        VIDEO_LOAD_TIMEOUT: 10000
+        TOPIC_FAILURE_COOLDOWN: 60 * 1000,
+        FEED_TARGET_WAIT: 5000
     };
 
+    const FEED_TARGET_SELECTORS = [
+        '#contents.ytd-rich-grid-renderer',
+        'ytd-browse[page-subtype="home"] #contents',
+        'ytd-search #contents',
+        'ytd-browse[page-subtype="channels"] #contents',
+        '#primary #contents',
+        '#contents'
+    ];
+
     const Logger = {
         info: (message, data = null) => console.log(`[Original v8.0] ${message}`, data || ''),
         error: (message, error = null) => console.error(`[Original ERROR] ${message}`, error || ''),
@@ -27,12 +36,19 @@
         constructor() {
             this.currentTopics = [];
             this.currentNegativeTopics = [];
+            this.contentTypeMask = ContentClassifier.allowedMask({});
             this.isGenerating = false;
             this.lastGeneration = 0;
             this.videoCache = new Map();
+            this.failedTopics = new Map();
             this.retryCount = 0;
             this.currentUrl = '';
             this.globalVideoIds = new Set();
+            this.renderedFeed = null;
+            this.lastFetchedVideos = null;
+            this.searchIndex = new FeedSearchIndex();
+            this.renderedCards = new Map();
+            this.searchQuery = '';
 
             this.initialize();
         }
@@ -100,6 +116,7 @@
         async handleStorageChange(changes) {
             try {
                 let shouldRegenerate = false;
+                let shouldRefilter = false;
 
                 if (changes.topics) {
                     const newTopics = changes.topics.newValue || [];
@@ -107,7 +124,15 @@
 
                     if (JSON.stringify(validTopics) !== JSON.stringify(this.currentTopics)) {
                         this.currentTopics = validTopics;
-                        shouldRegenerate = true;
+                        // Profile switches usually land on topics that are
+                        // already cached; then the feed is only re-ranked
+                        this.lastFetchedVideos = this.collectCachedVideos();
+                        this.updateSearchIndex(this.lastFetchedVideos || []);
+                        if (this.lastFetchedVideos) {
+                            shouldRefilter = true;
+                        } else {
+                            shouldRegenerate = true;
+                        }
                         Logger.info('Positive topics updated from storage', { count: validTopics.length });
                     }
                 }
@@ -118,18 +143,29 @@
 
                     if (JSON.stringify(validNegativeTopics) !== JSON.stringify(this.currentNegativeTopics)) {
                         this.currentNegativeTopics = validNegativeTopics;
-                        shouldRegenerate = true;
+                        shouldRefilter = true;
                         Logger.info('Negative topics updated from storage', { count: validNegativeTopics.length });
                     }
                 }
 
-                if (shouldRegenerate) {
+                if (changes.contentTypes) {
+                    const mask = ContentClassifier.allowedMask(changes.contentTypes.newValue || {});
+                    if (mask !== this.contentTypeMask) {
+                        this.contentTypeMask = mask;
+                        shouldRefilter = true;
+                        Logger.info('Content type filters updated from storage', { mask });
+                    }
+                }
+
+                if (shouldRegenerate || shouldRefilter) {
                     this.globalVideoIds.clear();
 
-                    if (this.currentTopics.length > 0 && this.shouldShowFeed()) {
+                    if (this.currentTopics.length === 0 || !this.shouldShowFeed()) {
+                        this.clearExistingFeed();
+                    } else if (shouldRegenerate) {
                         await this.queueFeedGeneration();
                     } else {
-                        this.clearExistingFeed();
+                        await this.refilterFeed();
                     }
                 }
             } catch (error) {
@@ -139,15 +175,16 @@
 
         async loadTopics() {
             try {
-                const data = await this.safeStorageGet(['topics', 'negativeTopics']);
+                const data = await this.safeStorageGet(['topics', 'negativeTopics', 'contentTypes']);
                 const topics = this.validateTopics(data.topics || []);
                 const negativeTopics = this.validateTopics(data.negativeTopics || []);
 
                 this.currentTopics = topics;
                 this.currentNegativeTopics = negativeTopics;
+                this.contentTypeMask = ContentClassifier.allowedMask(data.contentTypes || {});
 
                 if (topics.length > 0 && this.shouldShowFeed()) {
-                    setTimeout(() => this.queueFeedGeneration(), 2000);
+                    this.waitForFeedTarget().then(() => this.queueFeedGeneration());
                 }
 
                 Logger.info('Topics loaded from storage', {
@@ -164,6 +201,35 @@
             }
         }
 
+        // Resolve as soon as YouTube has rendered a page-specific container;
+        // the background worker keeps the topic cache warm, so this is the
+        // only thing left between page load and a rendered feed.
+        waitForFeedTarget() {
+            const pageSelectors = FEED_TARGET_SELECTORS.slice(0, 4);
+            const findTarget = () => pageSelectors.some(selector => document.querySelector(selector));
+
+            return new Promise(resolve => {
+                if (findTarget()) {
+                    resolve(true);
+                    return;
+                }
+
+                const observer = new MutationObserver(() => {
+                    if (findTarget()) {
+                        observer.disconnect();
+                        clearTimeout(timeout);
+                        resolve(true);
+                    }
+                });
+                const timeout = setTimeout(() => {
+                    observer.disconnect();
+                    resolve(false);
+                }, CONFIG.FEED_TARGET_WAIT);
+
+                observer.observe(document.documentElement, { childList: true, subtree: true });
+            });
+        }
+
         getPageType() {
             if (this.isVideoPage()) return 'video';
             if (this.isHomePage()) return 'home';
@@ -230,49 +296,93 @@
                     retryCount: this.retryCount
                 });
 
-                this.clearExistingFeed();
-
                 if (this.currentTopics.length === 0) {
+                    this.clearExistingFeed();
                     Logger.info('No topics to process');
                     return;
                 }
 
-                this.showLoadingIndicator();
+                // Keep the current feed on screen while revalidating; only fall
+                // back to the loader when there is nothing rendered yet.
+                if (!this.hasRenderedFeed()) {
+                    this.showLoadingIndicator();
+                }
 
                 const allVideos = await this.fetchAllVideosOriginal();
+                this.lastFetchedVideos = allVideos;
 
-                if (allVideos.length === 0) {
-                    this.showEmptyState();
-                    return;
-                }
+                await this.renderFeedVideos(allVideos);
 
-                const filteredVideos = this.applySimpleNegativeFiltering(allVideos);
+            } catch (error) {
+                Logger.error('Feed generation failed', error);
+                await this.handleGenerationError(error);
+            } finally {
+                this.isGenerating = false;
+                this.hideLoadingIndicator();
+            }
+        }
 
-                if (filteredVideos.length === 0) {
-                    this.showFilteredEmptyState();
-                    return;
-                }
+        // Filter, dedupe, sort and render already fetched videos
+        async renderFeedVideos(allVideos) {
+            if (allVideos.length === 0) {
+                this.clearExistingFeed();
+                this.showEmptyState();
+                return;
+            }
 
-                const uniqueVideos = this.removeDuplicatesAdvanced(filteredVideos);
-                const sortedVideos = this.sortVideosByViews(uniqueVideos);
+            const allowedVideos = allVideos.filter(video => ContentClassifier.isAllowed(video, this.contentTypeMask));
+            const filteredVideos = this.applySimpleNegativeFiltering(allowedVideos);
 
-                await this.createFeedUI(sortedVideos);
+            if (filteredVideos.length === 0) {
+                this.clearExistingFeed();
+                this.showFilteredEmptyState();
+                return;
+            }
+
+            const uniqueVideos = this.removeDuplicatesAdvanced(filteredVideos);
+            const sortedVideos = this.sortVideosByViews(uniqueVideos);
+            const feedDigest = FeedFetcher.computeDigest(sortedVideos) +
+                `:${this.currentNegativeTopics.length}:${this.contentTypeMask}`;
 
+            if (this.hasRenderedFeed() && this.renderedFeed?.digest === feedDigest) {
                 this.retryCount = 0;
-                Logger.info('Original feed generation completed successfully', {
-                    totalFetched: allVideos.length,
-                    afterFiltering: filteredVideos.length,
-                    afterDeduplication: uniqueVideos.length,
-                    finalCount: sortedVideos.length,
-                    pageType: this.getPageType()
-                });
+                this.reportTopicUsage();
+                Logger.info('Feed unchanged, skipping re-render', { finalCount: sortedVideos.length });
+                return;
+            }
+
+            this.clearExistingFeed();
+            await this.createFeedUI(sortedVideos);
+            this.renderedFeed = { digest: feedDigest, url: location.href };
+            this.reportTopicUsage();
+
+            this.retryCount = 0;
+            Logger.info('Original feed generation completed successfully', {
+                totalFetched: allVideos.length,
+                afterContentTypes: allowedVideos.length,
+                afterFiltering: filteredVideos.length,
+                afterDeduplication: uniqueVideos.length,
+                finalCount: sortedVideos.length,
+                pageType: this.getPageType()
+            });
+        }
+
+        // Negative and content type filters only change which fetched videos are shown, so
+        // re-run the local pipeline instead of fetching again
+        async refilterFeed() {
+            if (this.isGenerating || !this.lastFetchedVideos) {
+                await this.queueFeedGeneration();
+                return;
+            }
 
+            try {
+                this.isGenerating = true;
+                this.globalVideoIds.clear();
+                await this.renderFeedVideos(this.lastFetchedVideos);
             } catch (error) {
-                Logger.error('Feed generation failed', error);
-                await this.handleGenerationError(error);
+                Logger.error('Local re-filtering failed', error);
             } finally {
                 this.isGenerating = false;
-                this.hideLoadingIndicator();
             }
         }
 
@@ -280,8 +390,14 @@
             const allVideos = [];
             const fetchPromises = [];
 
+            // Index into a fresh instance and swap it in once everything has
+            // arrived, so the index only ever holds the current feed's videos
+            const searchIndex = new FeedSearchIndex();
             for (const topic of this.currentTopics) {
-                fetchPromises.push(this.fetchVideosForTopicWithViews(topic));
+                fetchPromises.push(this.fetchVideosForTopicWithViews(topic).then(videos => {
+                    searchIndex.addAll(videos);
+                    return videos;
+                }));
             }
 
             try {
@@ -295,6 +411,7 @@
                     }
                 });
 
+                this.searchIndex = searchIndex;
                 Logger.info(`Fetched ${allVideos.length} total videos from all topics`);
 
             } catch (error) {
@@ -312,8 +429,11 @@
             const filteredVideos = [];
             let blockedCount = 0;
 
+            this.searchIndex.addAll(videos);
+            const blockedIds = this.searchIndex.matchAny(this.currentNegativeTopics);
+
             for (const video of videos) {
-                if (this.shouldBlockVideoSimple(video)) {
+                if (blockedIds.has(video.id)) {
                     blockedCount++;
                     Logger.info(`BLOCKED: "${video.title}" by ${video.channel}`);
                     continue;
@@ -328,20 +448,6 @@
             return filteredVideos;
         }
 
-        shouldBlockVideoSimple(video) {
-            const title = (video.title || '').toLowerCase();
-            const channel = (video.channel || '').toLowerCase();
-
-            for (const filter of this.currentNegativeTopics) {
-                const filterLower = filter.toLowerCase();
-                if (title.includes(filterLower) || channel.includes(filterLower)) {
-                    return true;
-                }
-            }
-
-            return false;
-        }
-
         async fetchVideosForTopicWithViews(topic) {
             try {
                 const cached = this.getCachedVideos(topic);
@@ -350,64 +456,37 @@
                     return cached;
                 }
 
-                const videos = await this.fetchRealVideosWithViews(topic);
-                const uniqueVideos = this.filterTopicDuplicates(videos);
+                // FeedFetcher already retried this topic; a feed-level retry
+                // must not fetch it again until the cooldown has passed.
+                const failedAt = this.failedTopics.get(topic);
+                if (failedAt && Date.now() - failedAt < CONFIG.TOPIC_FAILURE_COOLDOWN) {
+                    Logger.info(`Skipping recently failed topic: ${topic}`);
+                    return [];
+                }
 
-                this.cacheVideos(topic, uniqueVideos);
+                const videos = await this.performVideoFetchWithViews(topic);
+                // SearchResultsParser already drops repeated IDs within a page
+                this.cacheVideos(topic, videos);
 
-                Logger.info(`Fetched ${uniqueVideos.length} unique videos for topic: ${topic}`);
-                return uniqueVideos;
+                Logger.info(`Fetched ${videos.length} unique videos for topic: ${topic}`);
+                return videos;
 
             } catch (error) {
                 Logger.error(`Failed to fetch videos for topic ${topic}`, error);
+                this.failedTopics.set(topic, Date.now());
                 return [];
             }
         }
 
-        filterTopicDuplicates(videos) {
-            const seen = new Set();
-            return videos.filter(video => {
-                if (seen.has(video.id)) return false;
-                seen.add(video.id);
-                return true;
-            });
-        }
-
-        async fetchRealVideosWithViews(topic) {
-            return new Promise((resolve, reject) => {
-                const timeout = setTimeout(() => {
-                    reject(new Error('Video fetch timeout'));
-                }, CONFIG.VIDEO_LOAD_TIMEOUT);
-
-                this.performVideoFetchWithViews(topic)
-                    .then(videos => {
-                        clearTimeout(timeout);
-                        resolve(videos);
-                    })
-                    .catch(error => {
-                        clearTimeout(timeout);
-                        reject(error);
-                    });
-            });
-        }
-
         async performVideoFetchWithViews(topic) {
             try {
-                const searchUrl = `https://www.youtube.com/results?search_query=${encodeURIComponent(topic)}`;
-
-                const response = await fetch(searchUrl, {
-                    credentials: 'same-origin',
-                    headers: {
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-                    }
-                });
+                const result = await FeedFetcher.fetchTopic(topic, html => SearchResultsParser.parseVideoDataWithViews(html, topic));
 
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                if (!result.changed) {
+                    Logger.info(`Search results unchanged for topic: ${topic}`, { source: result.source });
                 }
 
-                const html = await response.text();
-                return this.parseVideoDataWithViews(html, topic);
+                return result.videos;
 
             } catch (error) {
                 Logger.error(`Network request failed for topic ${topic}`, error);
@@ -415,193 +494,6 @@
             }
         }
 
-        parseVideoDataWithViews(html, topic) {
-            try {
-                const videos = [];
-
-                const ytDataMatch = html.match(/var ytInitialData = (\{.*?\});/s);
-                if (ytDataMatch) {
-                    try {
-                        const ytData = JSON.parse(ytDataMatch[1]);
-                        const videosFromYtData = this.extractVideosFromYtInitialData(ytData, topic);
-                        if (videosFromYtData.length > 0) {
-                            Logger.info(`Parsed ${videosFromYtData.length} videos from ytInitialData for: ${topic}`);
-                            return this.filterTopicDuplicates(videosFromYtData);
-                        }
-                    } catch (e) {
-                        Logger.warn('Failed to parse ytInitialData, falling back to regex', e);
-                    }
-                }
-
-                const videoIdRegex = /"videoId":"([^"]{11})"/g;
-                const matches = [...html.matchAll(videoIdRegex)];
-                const uniqueIds = [...new Set(matches.map(match => match[1]))];
-
-                for (const id of uniqueIds.slice(0, CONFIG.MAX_VIDEOS_PER_TOPIC)) {
-                    if (this.isYouTubeShort(html, id)) continue;
-
-                    const viewCount = this.extractViewCount(html, id);
-                    const title = this.extractVideoTitle(html, id) || `Video from ${topic}`;
-                    const channel = this.extractChannelName(html, id) || 'YouTube Channel';
-
-                    videos.push({
-                        id: id,
-                        topic: topic,
-                        title: title,
-                        channel: channel,
-                        views: viewCount,
-                        timestamp: Date.now()
-                    });
-                }
-
-                const uniqueVideos = this.filterTopicDuplicates(videos);
-                Logger.info(`Parsed ${uniqueVideos.length} unique videos for topic: ${topic}`);
-                return uniqueVideos;
-
-            } catch (error) {
-                Logger.error(`Failed to parse video data with views for topic ${topic}`, error);
-                return [];
-            }
-        }
-
-        extractVideosFromYtInitialData(ytData, topic) {
-            const videos = [];
-            const seenIds = new Set();
-
-            try {
-                const contents = ytData?.contents?.twoColumnSearchResultsRenderer
-                    ?.primaryContents?.sectionListRenderer?.contents || [];
-
-                for (const section of contents) {
-                    const items = section.itemSectionRenderer?.contents || [];
-
-                    for (const item of items) {
-                        const renderer = item.videoRenderer;
-                        if (!renderer) continue;
-
-                        const id = renderer.videoId;
-                        if (!id || seenIds.has(id)) continue;
-
-                        if (renderer.thumbnailOverlays?.some(overlay =>
-                            overlay.thumbnailOverlayTimeStatusRenderer?.style === 'SHORTS')) {
-                            continue;
-                        }
-
-                        const title = renderer.title?.runs?.[0]?.text ||
-                                     renderer.title?.simpleText ||
-                                     `Video from ${topic}`;
-
-                        const channel = renderer.ownerText?.runs?.[0]?.text ||
-                                       renderer.shortBylineText?.runs?.[0]?.text ||
-                                       'YouTube Channel';
-
-                        const viewCount = this.parseViewCountText(
-                            renderer.viewCountText?.simpleText ||
-                            renderer.shortViewCountText?.simpleText ||
-                            '0 views'
-                        );
-
-                        seenIds.add(id);
-                        videos.push({
-                            id: id,
-                            topic: topic,
-                            title: title,
-                            channel: channel,
-                            views: viewCount,
-                            timestamp: Date.now()
-                        });
-                    }
-                }
-
-            } catch (error) {
-                Logger.error('Error extracting from ytInitialData', error);
-            }
-
-            return videos;
-        }
-
-        extractViewCount(html, videoId) {
-            try {
-                const patterns = [
-                    new RegExp(`"videoId":"${videoId}"[^}]*?"viewCountText":\\{"simpleText":"([^"]+)"`),
-                    new RegExp(`"videoId":"${videoId}"[^}]*?"shortViewCountText":\\{"simpleText":"([^"]+)"`),
-                    new RegExp(`"videoId":"${videoId}"[^}]*?"viewCount":"([0-9,]+)"`),
-                ];
-
-                for (const pattern of patterns) {
-                    const match = html.match(pattern);
-                    if (match && match[1]) {
-                        return this.parseViewCountText(match[1]);
-                    }
-                }
-
-                return 0;
-
-            } catch (error) {
-                Logger.warn(`Failed to extract view count for video ${videoId}`, error);
-                return 0;
-            }
-        }
-
-        parseViewCountText(viewText) {
-            if (!viewText || typeof viewText !== 'string') return 0;
-
-            const cleaned = viewText.toLowerCase()
-                .replace(/views?/g, '')
-                .replace(/watching/g, '')
-                .trim();
-
-            if (!cleaned) return 0;
-
-            try {
-                if (cleaned.includes('b')) {
-                    return Math.floor(parseFloat(cleaned.replace(/[^\d.]/g, '')) * 1000000000);
-                } else if (cleaned.includes('m')) {
-                    return Math.floor(parseFloat(cleaned.replace(/[^\d.]/g, '')) * 1000000);
-                } else if (cleaned.includes('k')) {
-                    return Math.floor(parseFloat(cleaned.replace(/[^\d.]/g, '')) * 1000);
-                } else {
-                    return parseInt(cleaned.replace(/[^\d]/g, '')) || 0;
-                }
-            } catch (error) {
-                return 0;
-            }
-        }
-
-        isYouTubeShort(html, videoId) {
-            const shortsPatterns = [
-                new RegExp(`"videoId":"${videoId}"[^}]*"isShort":true`),
-                new RegExp(`"videoId":"${videoId}"[^}]*"shorts"`),
-                new RegExp(`"videoId":"${videoId}"[^}]*"verticalVideo":true`),
-                new RegExp(`/shorts/${videoId}`)
-            ];
-            return shortsPatterns.some(pattern => pattern.test(html));
-        }
-
-        extractVideoTitle(html, videoId) {
-            try {
-                const match = html.match(new RegExp(`"videoId":"${videoId}"[^}]*?"title":\\{"runs":\\[\\{"text":"([^"]+)"`));
-                return match ? this.decodeHtmlEntities(match[1]) : null;
-            } catch {
-                return null;
-            }
-        }
-
-        extractChannelName(html, videoId) {
-            try {
-                const match = html.match(new RegExp(`"videoId":"${videoId}"[^}]*?"ownerText":\\{"runs":\\[\\{"text":"([^"]+)"`));
-                return match ? this.decodeHtmlEntities(match[1]) : null;
-            } catch {
-                return null;
-            }
-        }
-
-        decodeHtmlEntities(str) {
-            const textarea = document.createElement('textarea');
-            textarea.innerHTML = str;
-            return textarea.value;
-        }
-
         removeDuplicatesAdvanced(videos) {
             const seenIds = new Set();
             const seenTitles = new Set();
@@ -654,6 +546,10 @@
 
                 this.insertFeedIntoDOM(container);
 
+                if (this.searchQuery) {
+                    this.filterRenderedFeed(this.searchQuery);
+                }
+
                 Logger.info('Original feed UI created successfully');
 
             } catch (error) {
@@ -699,12 +595,54 @@
                         🎯 Topic Feed Pro (${totalVideos} videos)
                     </h2>
                     ${subtitle}
+                    <div style="display: flex; align-items: center; gap: 12px; margin-top: 12px;">
+                        <input id="topic-feed-search-pro" type="search" placeholder="Search titles and channels..."
+                               autocomplete="off"
+                               style="flex: 0 1 360px; padding: 8px 12px; font-size: 14px; border-radius: 20px; border: 1px solid var(--yt-spec-10-percent-layer); background: transparent; color: var(--yt-spec-text-primary); outline: none;">
+                        <span id="topic-feed-search-count-pro" style="font-size: 12px; color: var(--yt-spec-text-secondary);"></span>
+                    </div>
                 </div>
             `;
 
+            const searchInput = header.querySelector('#topic-feed-search-pro');
+            if (searchInput) {
+                // Set as a property, never through the template: escapeHtml does not escape quotes
+                searchInput.value = this.searchQuery;
+                searchInput.addEventListener('input', () => this.filterRenderedFeed(searchInput.value));
+                // Keep YouTube's global keyboard shortcuts from firing while typing
+                searchInput.addEventListener('keydown', (e) => e.stopPropagation());
+            }
+
             return header;
         }
 
+        // Show only cards matching the query; touches just the cards whose
+        // visibility changes
+        filterRenderedFeed(query) {
+            const started = performance.now();
+            this.searchQuery = query;
+            const matches = this.searchIndex.search(query);
+            let visible = 0;
+
+            for (const [videoId, card] of this.renderedCards) {
+                const show = !matches || matches.has(videoId);
+                if (show) visible++;
+                if ((card.style.display === 'none') === show) {
+                    card.style.display = show ? '' : 'none';
+                }
+            }
+
+            const countLabel = document.getElementById('topic-feed-search-count-pro');
+            if (countLabel) {
+                countLabel.textContent = matches ? `${visible} of ${this.renderedCards.size} videos` : '';
+            }
+
+            const elapsed = performance.now() - started;
+            if (elapsed > 1) {
+                Logger.warn(`Local search took ${elapsed.toFixed(2)}ms`, { query, cards: this.renderedCards.size });
+            }
+        }
+
         formatViewCount(count) {
             if (count >= 1000000000) return (count / 1000000000).toFixed(1) + 'B';
             if (count >= 1000000) return (count / 1000000).toFixed(1) + 'M';
@@ -716,9 +654,11 @@
             const grid = document.createElement('div');
             grid.className = 'ytd-rich-grid-renderer';
             grid.style.cssText = `display: flex; flex-wrap: wrap; margin: 0 12px;`;
+            this.renderedCards.clear();
 
             videos.forEach((video, index) => {
                 const card = this.createVideoCard(video, index);
+                this.renderedCards.set(video.id, card);
                 grid.appendChild(card);
             });
 
@@ -840,17 +780,8 @@
 
         insertFeedIntoDOM(container) {
             try {
-                const targetSelectors = [
-                    '#contents.ytd-rich-grid-renderer',
-                    'ytd-browse[page-subtype="home"] #contents',
-                    'ytd-search #contents',
-                    'ytd-browse[page-subtype="channels"] #contents',
-                    '#primary #contents',
-                    '#contents'
-                ];
-
                 let target = null;
-                for (const selector of targetSelectors) {
+                for (const selector of FEED_TARGET_SELECTORS) {
                     target = document.querySelector(selector);
                     if (target && this.isValidInsertionTarget(target)) break;
                 }
@@ -887,6 +818,11 @@
             return true;
         }
 
+        hasRenderedFeed() {
+            return !!document.getElementById('topic-feed-container-pro') &&
+                   this.renderedFeed?.url === location.href;
+        }
+
         clearExistingFeed() {
             try {
                 ['topic-feed-container-pro', 'topic-feed-loader-pro', 'topic-feed-error-pro', 'topic-feed-empty-pro'].forEach(id => {
@@ -1033,6 +969,8 @@
                 window.addEventListener('beforeunload', () => {
                     if (this.generationTimeout) clearTimeout(this.generationTimeout);
                     this.videoCache.clear();
+                    this.failedTopics.clear();
+                    this.searchIndex.clear();
                     this.globalVideoIds.clear();
                     Logger.info('Extension cleanup completed');
                 });
@@ -1041,6 +979,23 @@
             }
         }
 
+        // Videos shared with the previous topics keep their postings
+        updateSearchIndex(videos) {
+            this.searchIndex.replaceAll(videos);
+        }
+
+        // Videos for every current topic from the in-memory cache, or null
+        // if any topic would need a fetch
+        collectCachedVideos() {
+            const allVideos = [];
+            for (const topic of this.currentTopics) {
+                const cached = this.getCachedVideos(topic);
+                if (!cached) return null;
+                allVideos.push(...cached);
+            }
+            return allVideos;
+        }
+
         getCachedVideos(topic) {
             const cached = this.videoCache.get(topic);
             if (cached && Date.now() - cached.timestamp < CONFIG.CACHE_DURATION) return cached.videos;
@@ -1051,6 +1006,16 @@
             this.videoCache.set(topic, { videos, timestamp: Date.now() });
         }
 
+        // Lets the background worker rank topics for idle-time refreshes
+        reportTopicUsage() {
+            try {
+                chrome.runtime.sendMessage({ type: 'topicsViewed', topics: this.currentTopics })
+                    .catch(error => Logger.warn('Failed to report topic usage', error));
+            } catch (error) {
+                Logger.warn('Failed to report topic usage', error);
+            }
+        }
+
         async safeStorageGet(keys) {
             try {
                 if (typeof chrome !== 'undefined' && chrome.storage) {
@@ -0,0 +1,337 @@
+/**
+ * YouTube Topic Feed Pro - Shared Fetch Layer
+ * Conditional search requests, result digests and compressed per-topic storage,
+ * with per-topic retries, adaptive timeouts and a shared circuit breaker.
+ * Loaded as a content script ahead of content.js and through importScripts in
+ * the background worker; both write the same `topicCache:*` entries.
+ */
+
+const FeedFetcher = {
+    SEARCH_URL: 'https://www.youtube.com/results?search_query=',
+    STORAGE_PREFIX: 'topicCache:',
+    FRESH_DURATION: 15 * 60 * 1000,
+
+    // Per-request resilience. Retries and timeouts apply to a single topic;
+    // the circuit breaker is shared by every context via storage because
+    // YouTube rate limits the browser as a whole.
+    POLICY: {
+        MAX_ATTEMPTS: 3,
+        BACKOFF_BASE: 500,
+        BACKOFF_MAX: 8000,
+        RETRY_BUDGET_RATIO: 0.2,
+        RETRY_BUDGET_MAX: 10,
+        DEFAULT_TIMEOUT: 10000,
+        TIMEOUT_MIN: 4000,
+        TIMEOUT_MAX: 20000,
+        TIMEOUT_MULTIPLIER: 2,
+        LATENCY_WINDOW: 50,
+        LATENCY_MIN_SAMPLES: 5,
+        BREAKER_THRESHOLD: 5,
+        BREAKER_COOLDOWN: 30 * 1000,
+        BREAKER_MAX_COOLDOWN: 10 * 60 * 1000
+    },
+    BREAKER_KEY: 'fetchBreaker',
+
+    latencySamples: [],
+    retryTokens: 3,
+    breakerQueue: Promise.resolve(),
+
+    // Fetch a topic's search results, revalidating against the stored entry.
+    // Resolves to { videos, digest, changed, source } where source is one of
+    // 'cache' (fresh entry, no request), 'revalidated' (304), 'network' or
+    // 'stale' (request failed or breaker open, older entry served instead).
+    async fetchTopic(topic, parse, options = {}) {
+        const entry = await this.readEntry(topic);
+
+        if (entry && !options.force && Date.now() - entry.fetchedAt < this.FRESH_DURATION) {
+            return { videos: await this.decodeVideos(entry), digest: entry.digest, changed: false, source: 'cache' };
+        }
+
+        try {
+            if (await this.isCircuitOpen()) {
+                throw new Error('Circuit open: YouTube requests paused after repeated failures');
+            }
+            return await this.fetchWithRetries(topic, parse, entry, options.maxAttempts || this.POLICY.MAX_ATTEMPTS);
+        } catch (error) {
+            if (!entry) throw error;
+            console.warn(`[FeedFetcher] Serving stale results for topic: ${topic}`, error.message);
+            return { videos: await this.decodeVideos(entry), digest: entry.digest, changed: false, source: 'stale' };
+        }
+    },
+
+    async fetchWithRetries(topic, parse, entry, maxAttempts) {
+        this.retryTokens = Math.min(this.POLICY.RETRY_BUDGET_MAX, this.retryTokens + this.POLICY.RETRY_BUDGET_RATIO);
+
+        for (let attempt = 1; ; attempt++) {
+            try {
+                return await this.fetchOnce(topic, parse, entry);
+            } catch (error) {
+                if (!error.retryable || attempt >= maxAttempts || this.retryTokens < 1 || await this.isCircuitOpen()) {
+                    throw error;
+                }
+                this.retryTokens -= 1;
+                const delay = this.backoffDelay(attempt, error.retryAfter);
+                console.warn(`[FeedFetcher] Retrying topic ${topic} in ${delay}ms (attempt ${attempt + 1}/${maxAttempts})`, error.message);
+                await new Promise(resolve => setTimeout(resolve, delay));
+            }
+        }
+    },
+
+    async fetchOnce(topic, parse, entry) {
+        const headers = { 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8' };
+        if (entry?.etag) headers['If-None-Match'] = entry.etag;
+        if (entry?.lastModified) headers['If-Modified-Since'] = entry.lastModified;
+
+        const timeout = this.currentTimeout();
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), timeout);
+        const started = Date.now();
+        let response;
+        let html = null;
+
+        try {
+            // 'include' rather than 'same-origin': the worker runs on the
+            // extension origin, and its cached results must carry the same
+            // cookies (Restricted Mode, region, consent) as the page's
+            response = await fetch(this.SEARCH_URL + encodeURIComponent(topic), {
+                credentials: 'include',
+                headers,
+                signal: controller.signal
+            });
+            if (response.ok) {
+                html = await response.text();
+            }
+        } catch (error) {
+            const timedOut = error.name === 'AbortError';
+            if (timedOut) this.recordLatency(timeout);
+            throw Object.assign(new Error(timedOut ? `Video fetch timeout after ${timeout}ms` : error.message), { retryable: true });
+        } finally {
+            clearTimeout(timer);
+        }
+
+        if (response.status === 429 || response.status >= 500) {
+            const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 0;
+            await this.recordFailure(retryAfter);
+            throw Object.assign(new Error(`HTTP ${response.status}: ${response.statusText}`), { retryable: true, retryAfter });
+        }
+
+        // Other 4xx responses say nothing about the service's health
+        if (response.ok || response.status === 304) {
+            this.recordLatency(Date.now() - started);
+            await this.recordSuccess();
+        }
+
+        if (response.status === 304 && entry) {
+            await this.touchEntry(topic, entry, response);
+            return { videos: await this.decodeVideos(entry), digest: entry.digest, changed: false, source: 'revalidated' };
+        }
+
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        const videos = parse(html);
+        const digest = this.computeDigest(videos);
+
+        if (entry && entry.digest === digest) {
+            await this.touchEntry(topic, entry, response);
+            return { videos, digest, changed: false, source: 'network' };
+        }
+
+        if (videos.length > 0) {
+            await this.writeEntry(topic, {
+                digest,
+                etag: response.headers.get('ETag') || null,
+                lastModified: response.headers.get('Last-Modified') || null,
+                fetchedAt: Date.now(),
+                ...await this.encodeVideos(videos)
+            });
+        }
+
+        return { videos, digest, changed: true, source: 'network' };
+    },
+
+    // Exponential backoff with full jitter, never shorter than Retry-After
+    backoffDelay(attempt, retryAfterSeconds = 0) {
+        const ceiling = Math.min(this.POLICY.BACKOFF_BASE * 2 ** (attempt - 1), this.POLICY.BACKOFF_MAX);
+        return Math.round(Math.max(Math.random() * ceiling, retryAfterSeconds * 1000));
+    },
+
+    recordLatency(ms) {
+        this.latencySamples.push(ms);
+        if (this.latencySamples.length > this.POLICY.LATENCY_WINDOW) {
+            this.latencySamples.shift();
+        }
+    },
+
+    // Timeout tracks the observed p95 latency instead of a fixed constant
+    currentTimeout() {
+        const samples = this.latencySamples;
+        if (samples.length < this.POLICY.LATENCY_MIN_SAMPLES) {
+            return this.POLICY.DEFAULT_TIMEOUT;
+        }
+        const sorted = [...samples].sort((a, b) => a - b);
+        const p95 = sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * 0.95))];
+        return Math.min(this.POLICY.TIMEOUT_MAX, Math.max(this.POLICY.TIMEOUT_MIN, p95 * this.POLICY.TIMEOUT_MULTIPLIER));
+    },
+
+    async readBreaker() {
+        try {
+            const data = await chrome.storage.local.get(this.BREAKER_KEY);
+            return data[this.BREAKER_KEY] || { failures: 0, opens: 0, openUntil: 0 };
+        } catch (error) {
+            return { failures: 0, opens: 0, openUntil: 0 };
+        }
+    },
+
+    async isCircuitOpen() {
+        const breaker = await this.readBreaker();
+        return breaker.openUntil > Date.now();
+    },
+
+    recordFailure(retryAfterSeconds) {
+        return this.updateBreaker(breaker => {
+            const now = Date.now();
+
+            // Requests already in flight when the circuit opened fail as well;
+            // they are part of the burst that opened it, not new evidence
+            if (breaker.openUntil > now) return false;
+
+            // A failure while half-open (cooldown over, no success yet) reopens at once
+            const halfOpen = breaker.opens > 0;
+            breaker.failures++;
+
+            if (breaker.failures >= this.POLICY.BREAKER_THRESHOLD || halfOpen) {
+                const cooldown = Math.min(this.POLICY.BREAKER_COOLDOWN * 2 ** breaker.opens, this.POLICY.BREAKER_MAX_COOLDOWN);
+                breaker.openUntil = now + Math.max(cooldown, retryAfterSeconds * 1000);
+                breaker.opens++;
+                breaker.failures = 0;
+                console.warn(`[FeedFetcher] Circuit opened for ${Math.round((breaker.openUntil - now) / 1000)}s`);
+            }
+            return true;
+        });
+    },
+
+    recordSuccess() {
+        return this.updateBreaker(breaker => {
+            if (breaker.failures === 0 && breaker.opens === 0) return false;
+            Object.assign(breaker, { failures: 0, opens: 0, openUntil: 0 });
+            return true;
+        });
+    },
+
+    // Topics are fetched concurrently; chain breaker updates so each
+    // read-modify-write sees the previous one instead of overwriting it.
+    // `mutate` returns false when there is nothing to write.
+    updateBreaker(mutate) {
+        const update = this.breakerQueue.then(async () => {
+            const breaker = await this.readBreaker();
+            if (mutate(breaker)) {
+                await chrome.storage.local.set({ [this.BREAKER_KEY]: breaker }).catch(() => {});
+            }
+        });
+        this.breakerQueue = update.catch(() => {});
+        return update;
+    },
+
+    // Order-sensitive FNV-1a over video IDs and coarse view buckets, so small
+    // view count drift does not register as a changed result page.
+    computeDigest(videos) {
+        let hash = 0x811c9dc5;
+        for (const video of videos) {
+            const key = `${video.id}:${this.viewBucket(video.views)}|`;
+            for (let i = 0; i < key.length; i++) {
+                hash ^= key.charCodeAt(i);
+                hash = Math.imul(hash, 0x01000193);
+            }
+        }
+        return (hash >>> 0).toString(16).padStart(8, '0') + videos.length.toString(16);
+    },
+
+    viewBucket(views) {
+        return views > 0 ? Math.floor(Math.log10(views) * 4) : 0;
+    },
+
+    storageKey(topic) {
+        return this.STORAGE_PREFIX + topic;
+    },
+
+    async readEntry(topic) {
+        try {
+            const key = this.storageKey(topic);
+            const data = await chrome.storage.local.get(key);
+            return data[key] || null;
+        } catch (error) {
+            console.warn('[FeedFetcher] Failed to read cache entry', error);
+            return null;
+        }
+    },
+
+    async writeEntry(topic, entry) {
+        try {
+            await chrome.storage.local.set({ [this.storageKey(topic)]: entry });
+        } catch (error) {
+            console.warn('[FeedFetcher] Failed to write cache entry', error);
+        }
+    },
+
+    // Drop entries that have not been refreshed within maxAge
+    async pruneEntries(maxAge) {
+        try {
+            const data = await chrome.storage.local.get(null);
+            const cutoff = Date.now() - maxAge;
+            const staleKeys = Object.keys(data).filter(key =>
+                key.startsWith(this.STORAGE_PREFIX) && !(data[key]?.fetchedAt > cutoff));
+            if (staleKeys.length > 0) {
+                await chrome.storage.local.remove(staleKeys);
+            }
+            return staleKeys.length;
+        } catch (error) {
+            console.warn('[FeedFetcher] Failed to prune cache entries', error);
+            return 0;
+        }
+    },
+
+    async touchEntry(topic, entry, response) {
+        entry.fetchedAt = Date.now();
+        entry.etag = response.headers.get('ETag') || entry.etag || null;
+        entry.lastModified = response.headers.get('Last-Modified') || entry.lastModified || null;
+        await this.writeEntry(topic, entry);
+    },
+
+    async encodeVideos(videos) {
+        const json = JSON.stringify(videos);
+        if (typeof CompressionStream === 'undefined') {
+            return { encoding: 'json', payload: json };
+        }
+        const stream = new Blob([json]).stream().pipeThrough(new CompressionStream('gzip'));
+        const bytes = new Uint8Array(await new Response(stream).arrayBuffer());
+        return { encoding: 'gzip', payload: this.bytesToBase64(bytes) };
+    },
+
+    async decodeVideos(entry) {
+        if (entry.encoding !== 'gzip') {
+            return JSON.parse(entry.payload);
+        }
+        const bytes = this.base64ToBytes(entry.payload);
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+        return JSON.parse(await new Response(stream).text());
+    },
+
+    bytesToBase64(bytes) {
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    },
+
+    base64ToBytes(base64) {
+        const binary = atob(base64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return bytes;
+    }
+};
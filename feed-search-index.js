@@ -0,0 +1,212 @@
+/**
+ * YouTube Topic Feed Pro - Feed Search Index
+ * In-memory n-gram index over video titles and channels. Lookups keep the
+ * substring semantics of negative filtering while only touching videos that
+ * share every bigram/trigram of the query. Videos dropped by a topic change
+ * are only marked removed, so switching back reuses their postings; the
+ * index is compacted once removed videos outnumber live ones.
+ */
+
+class FeedSearchIndex {
+    constructor() {
+        this.docs = [];
+        this.docByVideoId = new Map();
+        this.postings = new Map();
+        this.removed = 0;
+        this.lastSearch = null;
+    }
+
+    get size() {
+        return this.docs.length - this.removed;
+    }
+
+    // Index videos as they arrive; already indexed IDs are skipped
+    addAll(videos) {
+        for (const video of videos) {
+            this.add(video);
+        }
+    }
+
+    add(video) {
+        if (!video?.id) return;
+
+        const existing = this.docByVideoId.get(video.id);
+        if (existing !== undefined) {
+            this.revive(existing);
+            return;
+        }
+
+        // Title and channel are separate fields; a newline never appears in a
+        // query, so no match can span the two.
+        this.index(video.id, `${video.title || ''}\n${video.channel || ''}`.toLowerCase());
+    }
+
+    index(videoId, text) {
+        const docId = this.docs.length;
+        this.docs.push({ videoId, text, live: true });
+        this.docByVideoId.set(videoId, docId);
+
+        const seen = new Set();
+        for (let i = 0; i < text.length - 1; i++) {
+            for (const gram of [text.slice(i, i + 2), text.slice(i, i + 3)]) {
+                if (gram.length < 2 || gram.includes('\n') || seen.has(gram)) continue;
+                seen.add(gram);
+                let posting = this.postings.get(gram);
+                if (!posting) {
+                    posting = [];
+                    this.postings.set(gram, posting);
+                }
+                posting.push(docId);
+            }
+        }
+    }
+
+    revive(docId) {
+        const doc = this.docs[docId];
+        if (doc.live) return;
+        doc.live = true;
+        this.removed--;
+        this.lastSearch = null;
+    }
+
+    // Make `videos` the searchable set; videos already indexed are not
+    // tokenized again
+    replaceAll(videos) {
+        const videoIds = new Set(videos.map(video => video.id));
+        for (const doc of this.docs) {
+            const live = videoIds.has(doc.videoId);
+            if (doc.live !== live) {
+                doc.live = live;
+                this.removed += live ? -1 : 1;
+            }
+        }
+        this.lastSearch = null;
+        this.addAll(videos);
+
+        if (this.removed > this.size) {
+            this.compact();
+        }
+    }
+
+    compact() {
+        const live = this.docs.filter(doc => doc.live);
+        this.clear();
+        for (const doc of live) {
+            this.index(doc.videoId, doc.text);
+        }
+    }
+
+    // Video IDs whose title or channel contains `term` (case-insensitive)
+    match(term) {
+        return this.toVideoIds(this.matchDocs(term.toLowerCase()));
+    }
+
+    // Sorted docIds containing `needle`; needle must already be lowercase
+    matchDocs(needle) {
+        if (!needle) return [];
+
+        if (needle.length === 1) {
+            const out = [];
+            this.docs.forEach((doc, docId) => {
+                if (doc.live && doc.text.includes(needle)) out.push(docId);
+            });
+            return out;
+        }
+
+        const grams = needle.length === 2 ? [needle] : this.trigrams(needle);
+        const postings = [];
+        for (const gram of grams) {
+            const posting = this.postings.get(gram);
+            if (!posting) return [];
+            postings.push(posting);
+        }
+        postings.sort((a, b) => a.length - b.length);
+
+        let candidates = postings[0];
+        for (let i = 1; i < postings.length && candidates.length > 0; i++) {
+            candidates = this.intersect(candidates, postings[i]);
+        }
+
+        // Trigrams can co-occur without forming the full term
+        if (needle.length > 3) {
+            return candidates.filter(docId => this.docs[docId].live && this.docs[docId].text.includes(needle));
+        }
+        return this.removed > 0 ? candidates.filter(docId => this.docs[docId].live) : candidates;
+    }
+
+    // Whitespace-separated terms must all match; null means "no filter".
+    // While typing, each keystroke usually extends the previous query, so
+    // the previous result is narrowed instead of searching from scratch.
+    search(query) {
+        const normalized = (query || '').trim().toLowerCase();
+        const terms = normalized.split(/\s+/).filter(Boolean);
+        if (terms.length === 0) return null;
+
+        let docIds;
+        const previous = this.lastSearch;
+        if (previous && previous.size === this.docs.length && normalized.startsWith(previous.query)) {
+            docIds = previous.docIds.filter(docId => terms.every(term => this.docs[docId].text.includes(term)));
+        } else {
+            const matches = terms.map(term => this.matchDocs(term)).sort((a, b) => a.length - b.length);
+            docIds = matches[0];
+            for (let i = 1; i < matches.length && docIds.length > 0; i++) {
+                docIds = this.intersect(docIds, matches[i]);
+            }
+        }
+
+        this.lastSearch = { query: normalized, size: this.docs.length, docIds };
+        return this.toVideoIds(docIds);
+    }
+
+    toVideoIds(docIds) {
+        const result = new Set();
+        for (const docId of docIds) {
+            result.add(this.docs[docId].videoId);
+        }
+        return result;
+    }
+
+    // Video IDs matched by any phrase, e.g. the negative topic list
+    matchAny(phrases) {
+        const result = new Set();
+        for (const phrase of phrases) {
+            for (const id of this.match(phrase)) result.add(id);
+        }
+        return result;
+    }
+
+    trigrams(text) {
+        const grams = new Set();
+        for (let i = 0; i + 3 <= text.length; i++) {
+            grams.add(text.slice(i, i + 3));
+        }
+        return [...grams];
+    }
+
+    // Postings are appended in docId order, so both inputs are sorted
+    intersect(a, b) {
+        const out = [];
+        let i = 0;
+        let j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] === b[j]) {
+                out.push(a[i]);
+                i++;
+                j++;
+            } else if (a[i] < b[j]) {
+                i++;
+            } else {
+                j++;
+            }
+        }
+        return out;
+    }
+
+    clear() {
+        this.docs = [];
+        this.docByVideoId.clear();
+        this.postings.clear();
+        this.removed = 0;
+        this.lastSearch = null;
+    }
+}
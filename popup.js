@@ -26,6 +26,12 @@
     
     // Elements
     const elements = {
+        // Profiles
+        profileSelect: document.getElementById('profileSelect'),
+        profileInput: document.getElementById('profileInput'),
+        addProfileButton: document.getElementById('addProfileButton'),
+        deleteProfileButton: document.getElementById('deleteProfileButton'),
+        
         // Positive topics
         topicInput: document.getElementById('topicInput'),
         addButton: document.getElementById('addButton'),
@@ -37,13 +43,19 @@
         addNegativeButton: document.getElementById('addNegativeButton'),
         negativeTopicsContainer: document.getElementById('negativeTopics'),
         
+        // Content types
+        contentTypesContainer: document.getElementById('contentTypes'),
+        
         // Common elements
         message: document.getElementById('message'),
         stats: document.getElementById('stats')
     };
     
+    let profiles = {};
+    let activeProfile = ProfileStore.DEFAULT_PROFILE;
     let topics = [];
     let negativeTopics = [];
+    let contentTypes = { ...ContentClassifier.DEFAULT_CONTENT_TYPES };
     let isPerformanceMode = false;
     
     // Utility Functions
@@ -87,18 +99,12 @@
     // Storage Functions
     async function loadTopics() {
         try {
-            const data = await chrome.storage.local.get(['topics', 'negativeTopics']);
-            topics = Array.isArray(data.topics) ? data.topics : [];
-            negativeTopics = Array.isArray(data.negativeTopics) ? data.negativeTopics : [];
-            
-            Logger.info(`Loaded ${topics.length} positive topics and ${negativeTopics.length} negative topics`);
+            const data = await chrome.storage.local.get(['contentTypes']);
+            contentTypes = { ...ContentClassifier.DEFAULT_CONTENT_TYPES, ...data.contentTypes };
+            ({ profiles, activeProfile } = await ProfileStore.load());
             
-            // Enable performance mode for large lists
-            isPerformanceMode = (topics.length + negativeTopics.length) >= CONFIG.PERFORMANCE_THRESHOLD;
-            
-            renderTopics();
-            renderNegativeTopics();
-            updateStats();
+            applyActiveProfile();
+            renderContentTypes();
         } catch (error) {
             console.error('Failed to load topics:', error);
             showMessage('Failed to load topics', 'error');
@@ -107,17 +113,117 @@
     
     async function saveTopics() {
         try {
-            await chrome.storage.local.set({ 
-                topics: topics,
-                negativeTopics: negativeTopics 
-            });
-            Logger.info(`Saved ${topics.length} positive and ${negativeTopics.length} negative topics`);
+            await ProfileStore.save(profiles, activeProfile);
+            Logger.info(`Saved ${topics.length} positive and ${negativeTopics.length} negative topics to profile ${activeProfile}`);
         } catch (error) {
             console.error('Failed to save topics:', error);
             showMessage('Failed to save topics', 'error');
         }
     }
     
+    async function saveContentTypes() {
+        try {
+            await chrome.storage.local.set({ contentTypes: contentTypes });
+            Logger.info('Saved content types', contentTypes);
+        } catch (error) {
+            console.error('Failed to save content types:', error);
+            showMessage('Failed to save content types', 'error');
+        }
+    }
+    
+    // Point the topic lists at the active profile; edits to `topics` and
+    // `negativeTopics` then update `profiles` in place
+    function applyActiveProfile() {
+        const profile = profiles[activeProfile];
+        profile.topics = Array.isArray(profile.topics) ? profile.topics : [];
+        profile.negativeTopics = Array.isArray(profile.negativeTopics) ? profile.negativeTopics : [];
+        topics = profile.topics;
+        negativeTopics = profile.negativeTopics;
+        
+        Logger.info(`Loaded profile ${activeProfile}: ${topics.length} positive topics and ${negativeTopics.length} negative topics`);
+        
+        // Enable performance mode for large lists
+        isPerformanceMode = (topics.length + negativeTopics.length) >= CONFIG.PERFORMANCE_THRESHOLD;
+        
+        renderProfiles();
+        renderTopics();
+        renderNegativeTopics();
+        updateStats();
+    }
+    
+    // Profile Management
+    function renderProfiles() {
+        elements.profileSelect.innerHTML = '';
+        
+        for (const name of Object.keys(profiles)) {
+            const option = document.createElement('option');
+            option.value = name;
+            option.textContent = name;
+            option.selected = name === activeProfile;
+            elements.profileSelect.appendChild(option);
+        }
+        
+        elements.deleteProfileButton.disabled = Object.keys(profiles).length <= 1;
+    }
+    
+    async function switchProfile(name) {
+        try {
+            ({ profiles, activeProfile } = await ProfileStore.switchTo(name));
+            applyActiveProfile();
+            showMessage(`Switched to: ${activeProfile}`, 'success');
+        } catch (error) {
+            console.error('Failed to switch profile:', error);
+            showMessage('Failed to switch profile', 'error');
+            renderProfiles();
+        }
+    }
+    
+    async function addProfile(name) {
+        const validation = ProfileStore.validateName(name, profiles);
+        
+        if (!validation.isValid) {
+            showMessage(validation.error, 'error');
+            return false;
+        }
+        
+        profiles[validation.name] = { topics: [], negativeTopics: [] };
+        await saveTopics();
+        await switchProfile(validation.name);
+        
+        Logger.info(`Profile added. Total count: ${Object.keys(profiles).length}`);
+        return true;
+    }
+    
+    async function deleteProfile() {
+        const names = Object.keys(profiles);
+        if (names.length <= 1) return;
+        
+        const removedProfile = activeProfile;
+        delete profiles[removedProfile];
+        activeProfile = Object.keys(profiles)[0];
+        
+        try {
+            await ProfileStore.save(profiles, activeProfile);
+            await ProfileStore.forgetProfile(removedProfile);
+        } catch (error) {
+            console.error('Failed to delete profile:', error);
+            showMessage('Failed to delete profile', 'error');
+            return;
+        }
+        
+        applyActiveProfile();
+        showMessage(`Deleted profile: ${removedProfile}`, 'success');
+        
+        Logger.info(`Profile removed. Total count: ${Object.keys(profiles).length}`);
+    }
+    
+    // UI Functions for Content Types
+    function renderContentTypes() {
+        elements.contentTypesContainer.querySelectorAll('input[data-type]').forEach(input => {
+            input.checked = Boolean(contentTypes[input.dataset.type]);
+        });
+    }
+    
     // UI Functions for Positive Topics
     function renderTopics() {
         elements.topicsContainer.innerHTML = '';
@@ -372,6 +478,35 @@
     
     // Event Listeners
     function setupEventListeners() {
+        // Profiles
+        elements.profileSelect.addEventListener('change', () => {
+            switchProfile(elements.profileSelect.value);
+        });
+        
+        elements.addProfileButton.addEventListener('click', async () => {
+            if (await addProfile(elements.profileInput.value)) {
+                elements.profileInput.value = '';
+                updateAddProfileButtonState();
+            }
+        });
+        
+        elements.profileInput.addEventListener('input', updateAddProfileButtonState);
+        
+        elements.profileInput.addEventListener('keypress', async (e) => {
+            if (e.key === 'Enter' && !elements.addProfileButton.disabled) {
+                if (await addProfile(elements.profileInput.value)) {
+                    elements.profileInput.value = '';
+                    updateAddProfileButtonState();
+                }
+            }
+        });
+        
+        elements.deleteProfileButton.addEventListener('click', () => {
+            if (confirm(`Delete profile "${activeProfile}" and its topics?`)) {
+                deleteProfile();
+            }
+        });
+        
         // Positive topics
         elements.addButton.addEventListener('click', async () => {
             const topicText = elements.topicInput.value.trim();
@@ -414,6 +549,15 @@
             }
         });
         
+        // Content types
+        elements.contentTypesContainer.addEventListener('change', async (e) => {
+            const type = e.target.dataset.type;
+            if (!type) return;
+            
+            contentTypes[type] = e.target.checked;
+            await saveContentTypes();
+        });
+        
         // File import
         elements.fileInput.addEventListener('change', (e) => {
             const file = e.target.files[0];
@@ -428,6 +572,11 @@
         elements.addButton.disabled = !hasInput;
     }
     
+    function updateAddProfileButtonState() {
+        const hasInput = elements.profileInput.value.trim().length > 0;
+        elements.addProfileButton.disabled = !hasInput;
+    }
+    
     function updateNegativeAddButtonState() {
         const hasInput = elements.negativeTopicInput.value.trim().length > 0;
         elements.addNegativeButton.disabled = !hasInput;
@@ -439,6 +588,7 @@
         loadTopics();
         updateAddButtonState();
         updateNegativeAddButtonState();
+        updateAddProfileButtonState();
         
         Logger.info('Popup initialized with negative filtering support');
     }
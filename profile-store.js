@@ -0,0 +1,118 @@
+/**
+ * YouTube Topic Feed Pro - Profile Store
+ * Named topic sets ("Work", "Learning", ...) kept under `profiles`. The active
+ * profile is mirrored into the legacy `topics`/`negativeTopics` keys, which
+ * the content script keeps reading, so switching profiles looks like an
+ * ordinary topic edit to it. The background refresher reads `profiles`
+ * through load(). Anything that writes topics, including the tools that seed
+ * storage, goes through save() so the two never drift apart. Shared by the
+ * popup and the background worker.
+ */
+
+const ProfileStore = {
+    DEFAULT_PROFILE: 'Default',
+    MAX_NAME_LENGTH: 30,
+
+    // Migrates a pre-profile install by wrapping its topics in the default profile
+    async load() {
+        const data = await chrome.storage.local.get(['profiles', 'activeProfile', 'topics', 'negativeTopics']);
+        let profiles = data.profiles;
+        let activeProfile = data.activeProfile;
+
+        if (!profiles || typeof profiles !== 'object' || Object.keys(profiles).length === 0) {
+            profiles = {
+                [this.DEFAULT_PROFILE]: {
+                    topics: Array.isArray(data.topics) ? data.topics : [],
+                    negativeTopics: Array.isArray(data.negativeTopics) ? data.negativeTopics : []
+                }
+            };
+        }
+        if (!this.has(profiles, activeProfile)) {
+            activeProfile = Object.keys(profiles)[0];
+        }
+
+        return { profiles, activeProfile };
+    },
+
+    // Persist every profile and mirror the active one in a single write, so
+    // storage listeners never see the two out of sync
+    async save(profiles, activeProfile) {
+        const active = profiles[activeProfile];
+        await chrome.storage.local.set({
+            profiles,
+            activeProfile,
+            topics: active.topics,
+            negativeTopics: active.negativeTopics
+        });
+    },
+
+    async switchTo(name) {
+        const { profiles, activeProfile } = await this.load();
+        if (!this.has(profiles, name) || name === activeProfile) {
+            return { profiles, activeProfile };
+        }
+
+        await this.recordTransition(activeProfile, name);
+        await this.save(profiles, name);
+        return { profiles, activeProfile: name };
+    },
+
+    validateName(name, profiles) {
+        const trimmed = typeof name === 'string' ? name.trim() : '';
+        if (!trimmed) {
+            return { isValid: false, error: 'Profile name cannot be empty' };
+        }
+        if (trimmed.length > this.MAX_NAME_LENGTH) {
+            return { isValid: false, error: `Profile name must be less than ${this.MAX_NAME_LENGTH} characters` };
+        }
+        // Names are object keys; "__proto__", "constructor" and friends would
+        // resolve to Object.prototype members instead of profiles
+        if (trimmed in Object.prototype) {
+            return { isValid: false, error: 'Profile name is reserved' };
+        }
+        if (Object.keys(profiles).some(existing => existing.toLowerCase() === trimmed.toLowerCase())) {
+            return { isValid: false, error: 'Profile already exists' };
+        }
+        return { isValid: true, name: trimmed };
+    },
+
+    // Switch counts per (from, to) pair; the refresher prewarms the most
+    // frequent successor of the active profile
+    async recordTransition(from, to) {
+        const { profileTransitions = {} } = await chrome.storage.local.get('profileTransitions');
+        const counts = this.has(profileTransitions, from) ? profileTransitions[from] : {};
+        counts[to] = (counts[to] || 0) + 1;
+        profileTransitions[from] = counts;
+        await chrome.storage.local.set({ profileTransitions });
+    },
+
+    async predictNext(profiles, activeProfile) {
+        const { profileTransitions = {} } = await chrome.storage.local.get('profileTransitions');
+        let best = null;
+        let bestCount = 0;
+
+        const counts = this.has(profileTransitions, activeProfile) ? profileTransitions[activeProfile] : {};
+        for (const [name, count] of Object.entries(counts)) {
+            if (this.has(profiles, name) && name !== activeProfile && count > bestCount) {
+                best = name;
+                bestCount = count;
+            }
+        }
+        return best;
+    },
+
+    // Own-key lookup, so names never resolve through the prototype chain
+    has(map, name) {
+        return typeof name === 'string' && Object.hasOwn(map, name);
+    },
+
+    // Transition counts involving a deleted profile are dropped
+    async forgetProfile(name) {
+        const { profileTransitions = {} } = await chrome.storage.local.get('profileTransitions');
+        delete profileTransitions[name];
+        for (const counts of Object.values(profileTransitions)) {
+            delete counts[name];
+        }
+        await chrome.storage.local.set({ profileTransitions });
+    }
+};
@@ -0,0 +1,178 @@
+/**
+ * YouTube Topic Feed Pro - Search Results Parser
+ * Turns a /results page into video records. Shared by the content script and
+ * the background refresh worker, so it must not touch the DOM.
+ */
+
+const SearchResultsParser = {
+    MAX_VIDEOS_PER_TOPIC: 100,
+
+    parseVideoDataWithViews(html, topic) {
+        try {
+            const videos = [];
+
+            const ytDataMatch = html.match(/var ytInitialData = (\{.*?\});/s);
+            if (ytDataMatch) {
+                try {
+                    const ytData = JSON.parse(ytDataMatch[1]);
+                    const videosFromYtData = this.extractVideosFromYtInitialData(ytData, topic);
+                    if (videosFromYtData.length > 0) {
+                        console.log(`[SearchResultsParser] Parsed ${videosFromYtData.length} videos from ytInitialData for: ${topic}`);
+                        return this.filterTopicDuplicates(videosFromYtData);
+                    }
+                } catch (e) {
+                    console.warn('[SearchResultsParser] Failed to parse ytInitialData, falling back to regex', e);
+                }
+            }
+
+            const videoIdRegex = /"videoId":"([^"]{11})"/g;
+            const matches = [...html.matchAll(videoIdRegex)];
+            const uniqueIds = [...new Set(matches.map(match => match[1]))];
+            const shortIds = ContentClassifier.findShortIds(html);
+
+            for (const id of uniqueIds.slice(0, this.MAX_VIDEOS_PER_TOPIC)) {
+                const viewCount = this.extractViewCount(html, id);
+                const title = this.extractVideoTitle(html, id) || `Video from ${topic}`;
+                const channel = this.extractChannelName(html, id) || 'YouTube Channel';
+
+                videos.push({
+                    id: id,
+                    topic: topic,
+                    title: title,
+                    channel: channel,
+                    views: viewCount,
+                    contentType: shortIds.has(id) ? 'short' : 'regular',
+                    timestamp: Date.now()
+                });
+            }
+
+            const uniqueVideos = this.filterTopicDuplicates(videos);
+            console.log(`[SearchResultsParser] Parsed ${uniqueVideos.length} unique videos for topic: ${topic}`);
+            return uniqueVideos;
+
+        } catch (error) {
+            console.error(`[SearchResultsParser] Failed to parse video data with views for topic ${topic}`, error);
+            return [];
+        }
+    },
+
+    extractVideosFromYtInitialData(ytData, topic) {
+        const videos = [];
+        const viewTexts = [];
+        const seenIds = new Set();
+
+        try {
+            const contents = ytData?.contents?.twoColumnSearchResultsRenderer
+                ?.primaryContents?.sectionListRenderer?.contents || [];
+
+            for (const section of contents) {
+                const items = section.itemSectionRenderer?.contents || [];
+
+                for (const item of items) {
+                    const renderer = item.videoRenderer;
+                    if (!renderer) continue;
+
+                    const id = renderer.videoId;
+                    if (!id || seenIds.has(id)) continue;
+
+                    const title = renderer.title?.runs?.[0]?.text ||
+                                 renderer.title?.simpleText ||
+                                 `Video from ${topic}`;
+
+                    const channel = renderer.ownerText?.runs?.[0]?.text ||
+                                   renderer.shortBylineText?.runs?.[0]?.text ||
+                                   'YouTube Channel';
+
+                    seenIds.add(id);
+                    viewTexts.push(
+                        renderer.viewCountText?.simpleText ||
+                        renderer.viewCountText?.runs?.map(run => run.text).join('') ||
+                        renderer.shortViewCountText?.simpleText ||
+                        '0 views'
+                    );
+                    videos.push({
+                        id: id,
+                        topic: topic,
+                        title: title,
+                        channel: channel,
+                        views: 0,
+                        contentType: ContentClassifier.classifyRenderer(renderer),
+                        timestamp: Date.now()
+                    });
+                }
+            }
+
+            // One batch per result page; repeated strings hit the parser memo
+            const views = ViewCountParser.parseMany(viewTexts);
+            videos.forEach((video, index) => { video.views = views[index]; });
+
+        } catch (error) {
+            console.error('[SearchResultsParser] Error extracting from ytInitialData', error);
+        }
+
+        return videos;
+    },
+
+    extractViewCount(html, videoId) {
+        try {
+            const patterns = [
+                new RegExp(`"videoId":"${videoId}"[^}]*?"viewCountText":\\{"simpleText":"([^"]+)"`),
+                new RegExp(`"videoId":"${videoId}"[^}]*?"shortViewCountText":\\{"simpleText":"([^"]+)"`),
+                new RegExp(`"videoId":"${videoId}"[^}]*?"viewCount":"([0-9,]+)"`),
+            ];
+
+            for (const pattern of patterns) {
+                const match = html.match(pattern);
+                if (match && match[1]) {
+                    return ViewCountParser.parse(match[1]);
+                }
+            }
+
+            return 0;
+
+        } catch (error) {
+            console.warn(`[SearchResultsParser] Failed to extract view count for video ${videoId}`, error);
+            return 0;
+        }
+    },
+
+    extractVideoTitle(html, videoId) {
+        try {
+            const match = html.match(new RegExp(`"videoId":"${videoId}"[^}]*?"title":\\{"runs":\\[\\{"text":"([^"]+)"`));
+            return match ? this.decodeHtmlEntities(match[1]) : null;
+        } catch {
+            return null;
+        }
+    },
+
+    extractChannelName(html, videoId) {
+        try {
+            const match = html.match(new RegExp(`"videoId":"${videoId}"[^}]*?"ownerText":\\{"runs":\\[\\{"text":"([^"]+)"`));
+            return match ? this.decodeHtmlEntities(match[1]) : null;
+        } catch {
+            return null;
+        }
+    },
+
+    // DOM-free so the parser also runs inside the service worker
+    decodeHtmlEntities(str) {
+        const named = { amp: '&', lt: '<', gt: '>', quot: '"', apos: "'", nbsp: '\u00a0' };
+        return str.replace(/&(#x[0-9a-f]+|#\d+|[a-z]+);/gi, (entity, code) => {
+            if (code[0] === '#') {
+                const point = code[1].toLowerCase() === 'x' ? parseInt(code.slice(2), 16) : parseInt(code.slice(1), 10);
+                return Number.isFinite(point) ? String.fromCodePoint(point) : entity;
+            }
+            return named[code.toLowerCase()] ?? entity;
+        });
+    },
+
+    filterTopicDuplicates(videos) {
+        const seen = new Set();
+        return videos.filter(video => {
+            if (seen.has(video.id)) return false;
+            seen.add(video.id);
+            return true;
+        });
+    }
+
+};
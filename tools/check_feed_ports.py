@@ -0,0 +1,165 @@
+"""Check feed_profile.py's Python ports against the extension's JS modules.
+
+``feed_profile.py`` re-implements the view count rules, the content
+classifier and the search page parser so the offline pipeline can be
+profiled without a browser. This check keeps those copies honest:
+
+- the Python ports must pass the shared fixtures in ``tools/fixtures``;
+- with Node.js on PATH, the merged suffix/unit tables must equal
+  ``ViewCountParser.LOCALE_RULES``, ``ContentClassifier.classifyRenderer``
+  and ``findShortIds`` must agree on their fixtures, and ``SearchResultsParser`` must
+  produce the same records as the Python walk and regex fallback for
+  synthesized pages, well-formed and truncated.
+
+Exits non-zero on any mismatch. Without Node.js only the fixture checks run.
+
+Usage:
+    python tools/check_feed_ports.py
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import feed_profile
+from standin_server import render_results_page, synthesize_results
+
+TOOLS_DIR = Path(__file__).resolve().parent
+EXTENSION_DIR = TOOLS_DIR.parent
+RECORD_FIELDS = ("id", "title", "channel", "views", "content_type")
+
+NODE_BRIDGE = r"""
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const context = vm.createContext({ console: { log() {}, warn() {}, error() {} } });
+for (const file of ['view-count-parser.js', 'content-classifier.js', 'search-parser.js']) {
+    vm.runInContext(fs.readFileSync(path.join(process.argv[1], file), 'utf8'), context);
+}
+const { ViewCountParser, ContentClassifier, SearchResultsParser } = vm.runInContext(
+    '({ ViewCountParser, ContentClassifier, SearchResultsParser })', context);
+
+const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+const suffixes = {};
+const units = {};
+for (const rule of Object.values(ViewCountParser.LOCALE_RULES)) {
+    Object.assign(suffixes, rule.suffixes);
+    Object.assign(units, rule.units);
+}
+
+process.stdout.write(JSON.stringify({
+    suffixes,
+    units,
+    classified: input.renderers.map(renderer => ContentClassifier.classifyRenderer(renderer)),
+    shortIds: input.shortIdPages.map(html => [...ContentClassifier.findShortIds(html)].sort()),
+    pages: input.pages.map(([topic, html]) => SearchResultsParser.parseVideoDataWithViews(html, topic)
+        .map(video => ({ ...video, content_type: video.contentType })))
+}));
+"""
+
+
+def load_fixture(name):
+    return json.loads((TOOLS_DIR / "fixtures" / name).read_text(encoding="utf-8"))
+
+
+def sample_pages():
+    pages = []
+    for index, malformed in enumerate((False, False, True, True)):
+        topic = f"port check {index + 1}"
+        pages.append((topic, render_results_page(synthesize_results(topic, 30, seed=7), malformed=malformed)))
+    return pages
+
+
+def python_records(topic, html):
+    memo = {}
+    match = feed_profile.YT_DATA_PATTERN.search(html)
+    videos = []
+    if match:
+        try:
+            videos = feed_profile.walk_renderers(json.loads(match.group(1)), topic)
+        except json.JSONDecodeError:
+            videos = []
+        for video in videos:
+            video["views"] = feed_profile.parse_view_count(video.pop("view_text"), memo)
+    return videos or feed_profile.fallback_videos(html, topic, memo)
+
+
+def python_short_ids(html):
+    return sorted({next(group for group in match if group) for match in feed_profile.SHORT_ID_PATTERN.findall(html)})
+
+
+def project(records):
+    return [{field: record.get(field) for field in RECORD_FIELDS} for record in records]
+
+
+def check_fixtures(failures):
+    for fixture in load_fixture("view_counts.json"):
+        actual = feed_profile.parse_view_count(fixture["text"], {})
+        if actual != fixture["expected"]:
+            failures.append(f"view count {fixture['text']!r}: expected {fixture['expected']}, got {actual}")
+
+    for fixture in load_fixture("content_types.json"):
+        actual = feed_profile.classify_renderer(fixture["renderer"])
+        if actual != fixture["expected"]:
+            failures.append(f"content type {fixture['name']!r}: expected {fixture['expected']}, got {actual}")
+
+    for fixture in load_fixture("short_ids.json"):
+        actual = python_short_ids(fixture["html"])
+        if actual != sorted(fixture["expected"]):
+            failures.append(f"short ids {fixture['name']!r}: expected {fixture['expected']}, got {actual}")
+
+
+def check_against_js(node, failures):
+    renderers = [fixture["renderer"] for fixture in load_fixture("content_types.json")]
+    short_id_pages = [fixture["html"] for fixture in load_fixture("short_ids.json")]
+    pages = sample_pages()
+    result = subprocess.run(
+        [node, "-e", NODE_BRIDGE, str(EXTENSION_DIR)],
+        input=json.dumps({"renderers": renderers, "shortIdPages": short_id_pages, "pages": pages}),
+        capture_output=True, text=True, check=True,
+    )
+    js = json.loads(result.stdout)
+
+    if js["suffixes"] != feed_profile.VIEW_SUFFIXES:
+        failures.append(f"VIEW_SUFFIXES differ from view-count-parser.js: {js['suffixes']}")
+    if js["units"] != feed_profile.VIEW_UNITS:
+        failures.append(f"VIEW_UNITS differ from view-count-parser.js: {js['units']}")
+
+    for renderer, expected in zip(renderers, js["classified"]):
+        actual = feed_profile.classify_renderer(renderer)
+        if actual != expected:
+            failures.append(f"classify_renderer({renderer['videoId']}): JS says {expected}, Python {actual}")
+
+    for html, expected in zip(short_id_pages, js["shortIds"]):
+        actual = python_short_ids(html)
+        if actual != expected:
+            failures.append(f"findShortIds({html[:40]!r}...): JS says {expected}, Python {actual}")
+
+    for (topic, html), js_records in zip(pages, js["pages"]):
+        expected = project(js_records)
+        actual = project(python_records(topic, html))
+        if actual != expected:
+            failures.append(f"page {topic!r}: {len(actual)} Python records differ from {len(expected)} JS records")
+
+
+def main():
+    failures = []
+    check_fixtures(failures)
+
+    node = shutil.which("node")
+    if node:
+        check_against_js(node, failures)
+    else:
+        print("node not found; skipped comparison with the JS modules")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print("ports match" if not failures else f"{len(failures)} mismatch(es)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
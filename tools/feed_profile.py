@@ -0,0 +1,520 @@
+"""Offline replay of the content script's feed pipeline with opt-in profiling.
+
+Runs saved ``/results`` pages (or pages synthesized by ``standin_server``)
+through the same stages as ``SearchResultsParser`` and
+``YouTubeTopicFeedManager.renderFeedVideos``: ytInitialData location, JSON
+decode, renderer walk, view parsing, filtering, dedup and sorting. Pages whose
+ytInitialData is missing, malformed or empty take the parser's regex
+fallback, timed as its own ``fallback`` stage. Without ``--profile`` it only
+prints the feed summary. With it, one of:
+
+    stages   wall time per stage
+    alloc    stage times plus tracemalloc allocation counts and bytes
+    sample   a sampling profiler; collapsed stacks go to ``--flamegraph``
+             (feed to flamegraph.pl, speedscope or inferno)
+
+Everything is stdlib; nothing talks to the network. The ported rules are
+checked against the JS modules by ``check_feed_ports.py``.
+
+Usage:
+    python tools/feed_profile.py saved-pages/ --profile stages
+    python tools/feed_profile.py --synthesize 40 --profile sample \\
+        --flamegraph feed.folded
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import unicodedata
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from standin_server import render_results_page, synthesize_results
+
+STAGES = ("locate", "decode", "walk", "views", "fallback", "filter", "dedup", "sort")
+YT_DATA_PATTERN = re.compile(r"var ytInitialData = (\{.*?\});", re.S)
+
+# Mirrors SearchResultsParser's regex fallback in search-parser.js
+MAX_VIDEOS_PER_TOPIC = 100
+VIDEO_ID_PATTERN = re.compile(r'"videoId":"([^"]{11})"')
+SHORT_ID_PATTERN = re.compile(
+    r'/shorts/([\w-]{11})|"reelWatchEndpoint":\{"videoId":"([\w-]{11})"'
+    r'|"videoId":"([\w-]{11})"(?=[^}]*(?:"isShort":true|"verticalVideo":true|"shorts"))',
+    re.ASCII,
+)
+NAMED_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'", "nbsp": "\u00a0"}
+
+# Mirrors ContentClassifier in content-classifier.js
+CONTENT_TYPES = ("regular", "short", "live", "premiere")
+DEFAULT_CONTENT_TYPES = {"regular": True, "short": False, "live": True, "premiere": True}
+
+# Mirrors ViewCountParser.LOCALE_RULES in view-count-parser.js, merged the
+# way the 'auto' locale is
+VIEW_SUFFIXES = {
+    "k": 1e3, "m": 1e6, "b": 1e9, "thousand": 1e3, "million": 1e6, "billion": 1e9,
+    "tsd.": 1e3, "mio.": 1e6, "mrd.": 1e9, "md": 1e9, "mille": 1e3,
+    "mil": 1e3, "mil m": 1e9, "mi": 1e6, "bi": 1e9, "mila": 1e3, "mln": 1e6, "mrd": 1e9,
+    "тыс.": 1e3, "млн": 1e6, "млрд": 1e9,
+}
+VIEW_UNITS = {"千": 1e3, "万": 1e4, "萬": 1e4, "亿": 1e8, "億": 1e8, "천": 1e3, "만": 1e4, "억": 1e8}
+
+
+def suffix_key(suffix):
+    return re.sub(r"\.$", "", re.sub(r"\s+", " ", suffix))
+
+
+def compile_view_pattern():
+    multipliers = {}
+    alternatives = []
+    for suffix, value in VIEW_SUFFIXES.items():
+        key = suffix_key(suffix)
+        multipliers[key] = value
+        source = re.escape(key).replace(r"\ ", r"\s+")
+        alternatives.append((len(key), source + r"\.?(?![^\W\d_])"))
+    for unit, value in VIEW_UNITS.items():
+        multipliers[unit] = value
+        alternatives.append((len(unit), re.escape(unit)))
+    alternatives.sort(key=lambda item: -item[0])
+    group = "|".join(source for _, source in alternatives)
+    return re.compile(rf"(\d[\d.,' ]*)(?:\s*({group}))?"), multipliers
+
+
+VIEW_PATTERN, VIEW_MULTIPLIERS = compile_view_pattern()
+
+
+def parse_number(raw, has_suffix):
+    """Mirror of ViewCountParser.parseNumber: with both '.' and ',' present
+    the last one is the decimal mark; a lone separator is only decimal
+    before a suffix and with one or two digits after it ("1.5K")."""
+    separators = re.findall(r"[.,]", raw)
+    digits = re.sub(r"\D", "", raw)
+    digits_after = len(re.sub(r"\D", "", re.split(r"[.,]", raw)[-1]))
+    value = int(digits or 0)
+    if len(set(separators)) > 1 or (has_suffix and len(separators) == 1 and 1 <= digits_after <= 2):
+        return value / 10**digits_after
+    return value
+
+
+def parse_view_count(text, memo):
+    cached = memo.get(text)
+    if cached is not None:
+        return cached
+
+    normalized = re.sub("[\u00a0\u202f]", " ", text.lower()).strip()
+    match = VIEW_PATTERN.search(normalized)
+    value = 0
+    if match:
+        multiplier = VIEW_MULTIPLIERS[suffix_key(match.group(2))] if match.group(2) else 1
+        number = parse_number(match.group(1), multiplier != 1)
+        # Math.round semantics; Python's round() rounds halves to even
+        value = math.floor(number * multiplier + 0.5)
+    memo[text] = value
+    return value
+
+
+def classify_renderer(renderer):
+    endpoint = renderer.get("navigationEndpoint") or {}
+    url = endpoint.get("commandMetadata", {}).get("webCommandMetadata", {}).get("url", "")
+    overlay_style = next(
+        (
+            overlay["thumbnailOverlayTimeStatusRenderer"].get("style")
+            for overlay in renderer.get("thumbnailOverlays") or []
+            if overlay.get("thumbnailOverlayTimeStatusRenderer", {}).get("style")
+        ),
+        None,
+    )
+    if overlay_style == "SHORTS" or "reelWatchEndpoint" in endpoint or url.startswith("/shorts/"):
+        return "short"
+    if "upcomingEventData" in renderer or overlay_style == "UPCOMING":
+        return "premiere"
+    badges = renderer.get("badges") or []
+    if overlay_style == "LIVE" or any(
+        badge.get("metadataBadgeRenderer", {}).get("style") == "BADGE_STYLE_TYPE_LIVE_NOW" for badge in badges
+    ):
+        return "live"
+    return "regular"
+
+
+def first_run(field):
+    runs = (field or {}).get("runs") or [{}]
+    return runs[0].get("text")
+
+
+def walk_renderers(yt_data, topic):
+    sections = (
+        yt_data.get("contents", {})
+        .get("twoColumnSearchResultsRenderer", {})
+        .get("primaryContents", {})
+        .get("sectionListRenderer", {})
+        .get("contents", [])
+    )
+    videos = []
+    seen = set()
+    for section in sections:
+        for item in section.get("itemSectionRenderer", {}).get("contents", []):
+            renderer = item.get("videoRenderer")
+            if not renderer or not renderer.get("videoId") or renderer["videoId"] in seen:
+                continue
+            seen.add(renderer["videoId"])
+            title = renderer.get("title") or {}
+            view_count = renderer.get("viewCountText") or {}
+            videos.append({
+                "id": renderer["videoId"],
+                "topic": topic,
+                "title": first_run(title) or title.get("simpleText") or f"Video from {topic}",
+                "channel": first_run(renderer.get("ownerText")) or first_run(renderer.get("shortBylineText")) or "YouTube Channel",
+                "view_text": (
+                    view_count.get("simpleText")
+                    or "".join(run.get("text", "") for run in view_count.get("runs") or [])
+                    or (renderer.get("shortViewCountText") or {}).get("simpleText")
+                    or "0 views"
+                ),
+                "content_type": classify_renderer(renderer),
+            })
+    return videos
+
+
+def decode_html_entities(text):
+    def replace(match):
+        code = match.group(1)
+        if code[0] == "#":
+            point = int(code[2:], 16) if code[1].lower() == "x" else int(code[1:])
+            return chr(point)
+        return NAMED_ENTITIES.get(code.lower(), match.group(0))
+
+    return re.sub(r"&(#x[0-9a-f]+|#\d+|[a-z]+);", replace, text, flags=re.I)
+
+
+def fallback_videos(html, topic, memo):
+    """Per-ID regex scraping, used when ytInitialData yields nothing."""
+    unique_ids = list(dict.fromkeys(VIDEO_ID_PATTERN.findall(html)))
+    short_ids = {next(group for group in match if group) for match in SHORT_ID_PATTERN.findall(html)}
+    videos = []
+    for video_id in unique_ids[:MAX_VIDEOS_PER_TOPIC]:
+        prefix = f'"videoId":"{re.escape(video_id)}"[^}}]*?'
+        views = 0
+        for pattern in (r'"viewCountText":\{"simpleText":"([^"]+)"', r'"shortViewCountText":\{"simpleText":"([^"]+)"',
+                        r'"viewCount":"([0-9,]+)"'):
+            match = re.search(prefix + pattern, html)
+            if match:
+                views = parse_view_count(match.group(1), memo)
+                break
+        title = re.search(prefix + r'"title":\{"runs":\[\{"text":"([^"]+)"', html)
+        channel = re.search(prefix + r'"ownerText":\{"runs":\[\{"text":"([^"]+)"', html)
+        videos.append({
+            "id": video_id,
+            "topic": topic,
+            "title": decode_html_entities(title.group(1)) if title else f"Video from {topic}",
+            "channel": decode_html_entities(channel.group(1)) if channel else "YouTube Channel",
+            "views": views,
+            "content_type": "short" if video_id in short_ids else "regular",
+        })
+    return videos
+
+
+def normalize_title(title):
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", "", title.lower())).strip()
+
+
+def collation_key(title):
+    """Approximates ICU root collation, which backs ``localeCompare``.
+
+    Primary: accents and case ignored, punctuation before digits before
+    letters. Tertiary: lowercase before uppercase. Secondary accent ordering
+    is not modelled; it only matters for equal view counts anyway.
+    """
+    decomposed = unicodedata.normalize("NFKD", title)
+    base = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    primary = [(2 if char.isalpha() else 1 if char.isdigit() else 0, char) for char in base]
+    return primary, title.swapcase()
+
+
+class Instrumentation:
+    """Stage timers, optionally with tracemalloc allocation counts."""
+
+    def __init__(self, track_allocations=False):
+        self.track_allocations = track_allocations
+        self.totals = defaultdict(lambda: {"calls": 0, "ns": 0, "allocations": 0, "bytes": 0})
+
+    @contextmanager
+    def stage(self, name):
+        before = self.snapshot() if self.track_allocations else None
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            entry = self.totals[name]
+            entry["calls"] += 1
+            entry["ns"] += elapsed
+            if before is not None:
+                # Only count growth; frees inside the stage are not allocations
+                for stat in self.snapshot().compare_to(before, "filename"):
+                    if stat.count_diff > 0:
+                        entry["allocations"] += stat.count_diff
+                    if stat.size_diff > 0:
+                        entry["bytes"] += stat.size_diff
+
+    def snapshot(self):
+        # Snapshot objects are themselves traced; keep them out of the counts
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+    def report(self):
+        rows = []
+        total_ns = sum(entry["ns"] for entry in self.totals.values()) or 1
+        for name in STAGES:
+            entry = self.totals.get(name)
+            if not entry:
+                continue
+            row = {
+                "stage": name,
+                "calls": entry["calls"],
+                "total_ms": round(entry["ns"] / 1e6, 3),
+                "share": round(entry["ns"] / total_ns, 3),
+            }
+            if self.track_allocations:
+                row["allocations"] = entry["allocations"]
+                row["bytes"] = entry["bytes"]
+            rows.append(row)
+        return rows
+
+
+class NullInstrumentation:
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def report(self):
+        return []
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack on a timer and counts collapsed stacks.
+
+    Sampling from a helper thread keeps the per-call overhead of
+    ``sys.setprofile`` out of the numbers. Each stack is rooted at the
+    pipeline stage it was taken in, so the flamegraph splits by stage first.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self.stage_samples = Counter()
+        self.samples = 0
+        self.current_stage = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._target = None
+        self._switch_interval = None
+
+    def start(self):
+        self._target = threading.get_ident()
+        # The sampler only runs when the GIL is handed over, so shorten the
+        # switch interval to the sampling interval for the duration
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._run, name="feed-profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    @contextmanager
+    def stage(self, name):
+        self.current_stage = name
+        try:
+            yield
+        finally:
+            self.current_stage = None
+
+    def report(self):
+        return [
+            {"stage": name, "samples": self.stage_samples[name]}
+            for name in STAGES
+            if name in self.stage_samples
+        ]
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            stage = self.current_stage
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(f"stage:{stage or 'other'}")
+            self.stacks[";".join(reversed(stack))] += 1
+            self.stage_samples[stage or "other"] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def run_pipeline(pages, negative_topics, content_types, instrumentation):
+    allowed = {name for name in CONTENT_TYPES if content_types.get(name)}
+    memo = {}
+    all_videos = []
+
+    fallback_pages = 0
+
+    for topic, html in pages:
+        videos = []
+        with instrumentation.stage("locate"):
+            match = YT_DATA_PATTERN.search(html)
+        yt_data = None
+        if match:
+            with instrumentation.stage("decode"):
+                try:
+                    yt_data = json.loads(match.group(1))
+                except json.JSONDecodeError:
+                    pass
+        if yt_data is not None:
+            with instrumentation.stage("walk"):
+                videos = walk_renderers(yt_data, topic)
+            with instrumentation.stage("views"):
+                for video in videos:
+                    video["views"] = parse_view_count(video.pop("view_text"), memo)
+        if not videos:
+            fallback_pages += 1
+            with instrumentation.stage("fallback"):
+                videos = fallback_videos(html, topic, memo)
+        all_videos.extend(videos)
+
+    with instrumentation.stage("filter"):
+        needles = [topic.lower() for topic in negative_topics]
+        filtered = [
+            video for video in all_videos
+            if video["content_type"] in allowed
+            and not any(needle in video["title"].lower() or needle in video["channel"].lower() for needle in needles)
+        ]
+
+    with instrumentation.stage("dedup"):
+        seen_ids = set()
+        seen_titles = set()
+        unique = []
+        for video in filtered:
+            title = normalize_title(video["title"])
+            if video["id"] in seen_ids or title in seen_titles:
+                continue
+            seen_ids.add(video["id"])
+            seen_titles.add(title)
+            unique.append(video)
+
+    with instrumentation.stage("sort"):
+        unique.sort(key=lambda video: (-video["views"], collation_key(video["title"])))
+
+    return {
+        "fallback_pages": fallback_pages,
+        "fetched": len(all_videos),
+        "filtered": len(filtered),
+        "final": len(unique),
+    }
+
+
+def load_pages(paths):
+    pages = []
+    for path in map(Path, paths):
+        files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        for file in files:
+            pages.append((file.stem.replace("-", " "), file.read_text(encoding="utf-8")))
+    return pages
+
+
+def synthesized_pages(count, videos_per_page, seed, malformed=0):
+    pages = []
+    for index in range(count):
+        topic = f"profile topic {index + 1:03d}"
+        data = synthesize_results(topic, videos_per_page, seed)
+        pages.append((topic, render_results_page(data, malformed=index < malformed)))
+    return pages
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", help="saved /results HTML files or directories of them")
+    parser.add_argument("--synthesize", type=int, default=0, help="also generate this many stand-in pages")
+    parser.add_argument("--videos-per-page", type=int, default=20)
+    parser.add_argument("--malformed", type=int, default=0, help="how many synthesized pages are truncated")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--negative", action="append", default=[], help="negative topic (repeatable)")
+    parser.add_argument("--content-types", help='JSON object like the popup setting, e.g. \'{"short": true}\'')
+    parser.add_argument("--iterations", type=positive_int, default=1, help="replay the pages this many times")
+    parser.add_argument("--profile", choices=("stages", "alloc", "sample"), help="enable instrumentation")
+    parser.add_argument("--flamegraph", default="feed-profile.folded", help="collapsed stack output for --profile sample")
+    parser.add_argument("--interval", type=float, default=1.0, help="sampling interval in ms")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.pages)
+    if args.synthesize:
+        pages += synthesized_pages(args.synthesize, args.videos_per_page, args.seed, args.malformed)
+    if not pages:
+        parser.error("no pages given; pass HTML files/directories or --synthesize N")
+
+    content_types = dict(DEFAULT_CONTENT_TYPES)
+    if args.content_types:
+        content_types.update(json.loads(args.content_types))
+
+    instrumentation = NullInstrumentation()
+    profiler = None
+    if args.profile in ("stages", "alloc"):
+        instrumentation = Instrumentation(track_allocations=args.profile == "alloc")
+    if args.profile == "alloc":
+        tracemalloc.start()
+    if args.profile == "sample":
+        profiler = SamplingProfiler(args.interval / 1000)
+        instrumentation = profiler
+        profiler.start()
+
+    start = time.perf_counter()
+    try:
+        for _ in range(args.iterations):
+            counts = run_pipeline(pages, args.negative, content_types, instrumentation)
+    finally:
+        if profiler:
+            profiler.stop()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    report = {
+        "pages": len(pages),
+        "iterations": args.iterations,
+        "elapsed_ms": round(elapsed_ms, 2),
+        **counts,
+        "stages": instrumentation.report(),
+    }
+    if profiler:
+        profiler.write_collapsed(args.flamegraph)
+        report["samples"] = profiler.samples
+        report["flamegraph"] = args.flamegraph
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Headless load-test driver for the extension against the local stand-in.
+
+Launches Chromium with the unpacked extension, maps www.youtube.com onto
+``standin_server`` (every other host fails to resolve) and opens the home
+page with a configured topic set. Each
+run records end-to-end feed time, the outcome (feed, empty or error state),
+feed-level retries from ``handleGenerationError``, per-topic retries from
+``FeedFetcher`` and the request counts the stand-in saw. With ``--baseline``
+the summary is compared against a previous run and the exit status is
+non-zero on a regression.
+
+Requires Playwright (``pip install playwright && playwright install chromium``)
+and the openssl CLI for the throwaway TLS certificate.
+
+Usage:
+    python tools/loadtest.py --scenario tools/scenarios/rate-limited.json \\
+        --topics 40 --runs 3 --output result.json
+"""
+
+import argparse
+import json
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from standin_server import load_scenario, start_server
+
+EXTENSION_DIR = Path(__file__).resolve().parent.parent
+FEED_OUTCOMES = {
+    "#topic-feed-container-pro": "feed",
+    "#topic-feed-empty-pro": "empty",
+    "#topic-feed-error-pro": "error",
+}
+RETRY_PATTERN = re.compile(r"Retrying feed generation \(attempt (\d+)/(\d+)\)")
+TOPIC_RETRY_PATTERN = re.compile(r"\[FeedFetcher\] Retrying topic ")
+
+# onInstalled in background.js initializes `profiles`; seeding before it has
+# run would have the seeded topics overwritten by the empty default profile
+PROFILES_READY = "async () => Boolean((await chrome.storage.local.get('profiles')).profiles)"
+SEED_TOPICS = """async topics => {
+    const profiles = { [ProfileStore.DEFAULT_PROFILE]: { topics, negativeTopics: [] } };
+    await ProfileStore.save(profiles, ProfileStore.DEFAULT_PROFILE);
+}"""
+
+
+def default_topics(count):
+    return [f"load topic {index + 1:03d}" for index in range(count)]
+
+
+def extension_worker(context, timeout_s=10):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        for worker in context.service_workers:
+            if worker.url.startswith("chrome-extension://"):
+                return worker
+        context.wait_for_event("serviceworker", timeout=timeout_s * 1000)
+    raise RuntimeError("extension service worker did not start")
+
+
+def seed_topics(worker, topics, timeout_s=10):
+    deadline = time.monotonic() + timeout_s
+    while not worker.evaluate(PROFILES_READY):
+        if time.monotonic() > deadline:
+            raise RuntimeError("extension did not initialize its profiles")
+        time.sleep(0.05)
+    # Written through ProfileStore so `profiles` and the mirrored `topics`
+    # stay in step for both the content script and the background refresher
+    worker.evaluate(SEED_TOPICS, topics)
+
+
+def run_once(playwright, port, topics, timeout_s, state, warm_runs=0):
+    profile_dir = tempfile.mkdtemp(prefix="topicfeed-profile-")
+    context = playwright.chromium.launch_persistent_context(
+        profile_dir,
+        channel="chromium",
+        headless=True,
+        ignore_https_errors=True,
+        args=[
+            f"--disable-extensions-except={EXTENSION_DIR}",
+            f"--load-extension={EXTENSION_DIR}",
+            # Everything but the stand-in fails to resolve (thumbnails on
+            # i.ytimg.com included), so runs are offline and repeatable
+            f"--host-resolver-rules=MAP www.youtube.com 127.0.0.1:{port},MAP * ~NOTFOUND",
+            "--ignore-certificate-errors",
+        ],
+    )
+    try:
+        worker = extension_worker(context)
+        seed_topics(worker, topics)
+
+        page = context.new_page()
+        retries = []
+        topic_retries = []
+
+        def on_console(message):
+            match = RETRY_PATTERN.search(message.text)
+            if match:
+                retries.append(int(match.group(1)))
+            if TOPIC_RETRY_PATTERN.search(message.text):
+                topic_retries.append(message.text)
+
+        page.on("console", on_console)
+
+        for _ in range(warm_runs):
+            page.goto("https://www.youtube.com/")
+            page.wait_for_selector(", ".join(FEED_OUTCOMES), timeout=timeout_s * 1000)
+        state.reset()
+        retries.clear()
+        topic_retries.clear()
+
+        started = time.monotonic()
+        page.goto("https://www.youtube.com/")
+        outcome = "timeout"
+        try:
+            handle = page.wait_for_selector(", ".join(FEED_OUTCOMES), timeout=timeout_s * 1000)
+            element_id = "#" + handle.get_attribute("id")
+            outcome = FEED_OUTCOMES.get(element_id, "unknown")
+        except Exception:
+            pass
+        elapsed_ms = (time.monotonic() - started) * 1000
+
+        video_count = page.evaluate(
+            "() => document.querySelectorAll('#topic-feed-container-pro .ytd-rich-item-renderer').length")
+        stats = state.stats()
+        return {
+            "outcome": outcome,
+            "feed_time_ms": round(elapsed_ms, 1),
+            "videos": video_count,
+            "feed_retries": max(retries, default=0),
+            "topic_retries": len(topic_retries),
+            "requests": stats["requests"],
+            "statuses": stats["statuses"],
+            "max_requests_per_topic": max((sum(c.values()) for c in stats["queries"].values()), default=0),
+        }
+    finally:
+        context.close()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def summarize(runs):
+    times = [run["feed_time_ms"] for run in runs]
+    return {
+        "runs": len(runs),
+        "outcomes": {o: sum(1 for r in runs if r["outcome"] == o) for o in sorted({r["outcome"] for r in runs})},
+        "feed_time_ms_median": round(statistics.median(times), 1),
+        "feed_time_ms_max": round(max(times), 1),
+        "requests_median": statistics.median(run["requests"] for run in runs),
+        "feed_retries_max": max(run["feed_retries"] for run in runs),
+        "topic_retries_max": max(run["topic_retries"] for run in runs),
+        "max_requests_per_topic": max(run["max_requests_per_topic"] for run in runs),
+    }
+
+
+def compare(summary, baseline, tolerance):
+    """Return regression messages for metrics that grew beyond tolerance."""
+    regressions = []
+    for key in ("feed_time_ms_median", "requests_median", "max_requests_per_topic"):
+        before, after = baseline.get(key), summary.get(key)
+        if before and after > before * (1 + tolerance):
+            regressions.append(f"{key}: {before} -> {after}")
+    if summary["outcomes"].get("feed", 0) < baseline.get("outcomes", {}).get("feed", 0):
+        regressions.append(f"successful feeds: {baseline['outcomes'].get('feed', 0)} -> {summary['outcomes'].get('feed', 0)}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", help="stand-in scenario JSON file")
+    parser.add_argument("--topics", type=int, default=10, help="number of synthetic topics")
+    parser.add_argument("--topics-file", help="file with one topic per line (overrides --topics)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--warm", type=int, default=0, help="page loads before measuring, to test warm caches")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for a feed outcome")
+    parser.add_argument("--output", help="write the JSON summary here")
+    parser.add_argument("--baseline", help="previous summary JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative growth before failing")
+    args = parser.parse_args(argv)
+
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("loadtest requires Playwright: pip install playwright && playwright install chromium", file=sys.stderr)
+        return 2
+
+    if args.topics_file:
+        topics = [line.strip() for line in Path(args.topics_file).read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        topics = default_topics(args.topics)
+
+    server, state = start_server(load_scenario(args.scenario))
+    port = server.server_address[1]
+    runs = []
+    try:
+        with sync_playwright() as playwright:
+            for index in range(args.runs):
+                result = run_once(playwright, port, topics, args.timeout, state, args.warm)
+                print(f"run {index + 1}/{args.runs}: {json.dumps(result)}")
+                runs.append(result)
+    finally:
+        server.shutdown()
+
+    summary = summarize(runs)
+    summary["topics"] = len(topics)
+    summary["scenario"] = args.scenario
+    print(json.dumps(summary, indent=2))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"summary": summary, "runs": runs}, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(summary, baseline.get("summary", baseline), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
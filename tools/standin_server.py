@@ -0,0 +1,300 @@
+"""Local YouTube stand-in for replaying search traffic against the extension.
+
+Serves a minimal YouTube shell page and ``/results`` search pages, either
+from recorded HTML files or synthesized deterministically from the query.
+A scenario file controls latency, HTTP errors, rate limiting (429) and
+malformed ``ytInitialData`` so ``YouTubeTopicFeedManager`` can be exercised
+offline. Per-query request counts are exposed at ``/__standin/stats``.
+
+Usage:
+    python tools/standin_server.py --scenario tools/scenarios/baseline.json
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_SCENARIO = {
+    "seed": 1,
+    "videos_per_page": 20,
+    "latency_ms": 50,
+    "latency_jitter_ms": 0,
+    "error_rate": 0.0,
+    "malformed_rate": 0.0,
+    "etag": True,
+    "rate_limit": None,
+    "recordings": None,
+    "topics": {},
+}
+
+SHELL_PAGE = """<!DOCTYPE html>
+<html><head><title>YouTube</title></head>
+<body>
+<ytd-app>
+  <ytd-browse page-subtype="home">
+    <div id="primary"><div id="contents" class="ytd-rich-grid-renderer"></div></div>
+  </ytd-browse>
+</ytd-app>
+</body></html>
+"""
+
+
+def load_scenario(path=None):
+    scenario = dict(DEFAULT_SCENARIO)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            scenario.update(json.load(f))
+    return scenario
+
+
+class TokenBucket:
+    """Global request limiter; requests beyond capacity get HTTP 429."""
+
+    def __init__(self, capacity, refill_per_second):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StandinState:
+    """Scenario plus request accounting shared by all handler threads."""
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.lock = threading.Lock()
+        limit = scenario.get("rate_limit")
+        self.bucket = TokenBucket(limit["capacity"], limit["refill_per_second"]) if limit else None
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.attempts = Counter()
+            self.statuses = Counter()
+            self.by_query = defaultdict(Counter)
+            self.started = time.monotonic()
+
+    def next_attempt(self, query):
+        with self.lock:
+            self.attempts[query] += 1
+            return self.attempts[query]
+
+    def record(self, query, status):
+        with self.lock:
+            self.statuses[status] += 1
+            self.by_query[query][status] += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": sum(self.statuses.values()),
+                "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+                "queries": {q: {str(k): v for k, v in c.items()} for q, c in sorted(self.by_query.items())},
+                "elapsed_s": round(time.monotonic() - self.started, 3),
+            }
+
+    def settings_for(self, query):
+        settings = dict(self.scenario)
+        settings.update(self.scenario.get("topics", {}).get(query, {}))
+        return settings
+
+
+def rng_for(seed, query, attempt):
+    """Deterministic per (query, attempt) so thread interleaving does not matter."""
+    digest = hashlib.sha256(f"{seed}:{query}:{attempt}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def synthesize_results(query, count, seed):
+    rng = rng_for(seed, query, 0)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    items = []
+    for index in range(count):
+        video_id = "".join(rng.choice(alphabet) for _ in range(11))
+        views = int(10 ** rng.uniform(2, 8))
+        renderer = {
+            "videoId": video_id,
+            "title": {"runs": [{"text": f"{query.title()} video {index + 1}"}]},
+            "ownerText": {"runs": [{"text": f"Channel {rng.randint(1, 50)}"}]},
+            "viewCountText": {"simpleText": f"{views:,} views"},
+            "thumbnailOverlays": [],
+        }
+        if rng.random() < 0.1:
+            renderer["thumbnailOverlays"].append({"thumbnailOverlayTimeStatusRenderer": {"style": "SHORTS"}})
+        items.append({"videoRenderer": renderer})
+
+    return {
+        "contents": {
+            "twoColumnSearchResultsRenderer": {
+                "primaryContents": {
+                    "sectionListRenderer": {"contents": [{"itemSectionRenderer": {"contents": items}}]}
+                }
+            }
+        }
+    }
+
+
+def recorded_page(directory, query):
+    slug = re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")
+    path = Path(directory) / f"{slug}.html"
+    return path.read_text(encoding="utf-8") if path.is_file() else None
+
+
+def render_results_page(data, malformed):
+    payload = json.dumps(data, separators=(",", ":"))
+    if malformed:
+        payload = payload[: len(payload) // 2]
+    return f'<!DOCTYPE html><html><body><script>var ytInitialData = {payload};</script></body></html>'
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "YouTubeStandin/1.0"
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/__standin/stats":
+            self.send_body(200, json.dumps(self.state.stats()), "application/json")
+        elif url.path == "/__standin/reset":
+            self.state.reset()
+            self.send_body(200, "{}", "application/json")
+        elif url.path == "/results":
+            query = parse_qs(url.query).get("search_query", [""])[0]
+            self.serve_results(query)
+        else:
+            self.send_body(200, SHELL_PAGE, "text/html")
+
+    def serve_results(self, query):
+        settings = self.state.settings_for(query)
+        attempt = self.state.next_attempt(query)
+        rng = rng_for(settings["seed"], query, attempt)
+
+        time.sleep((settings["latency_ms"] + rng.uniform(0, settings["latency_jitter_ms"])) / 1000)
+
+        if self.state.bucket and not self.state.bucket.take():
+            self.state.record(query, 429)
+            self.send_body(429, "Too Many Requests", "text/plain", {"Retry-After": "1"})
+            return
+
+        if rng.random() < settings["error_rate"]:
+            status = rng.choice([500, 502, 503])
+            self.state.record(query, status)
+            self.send_body(status, "Server Error", "text/plain")
+            return
+
+        html = recorded_page(settings["recordings"], query) if settings["recordings"] else None
+        if html is None:
+            data = synthesize_results(query, settings["videos_per_page"], settings["seed"])
+            html = render_results_page(data, rng.random() < settings["malformed_rate"])
+
+        headers = {}
+        if settings["etag"]:
+            etag = '"' + hashlib.sha1(html.encode()).hexdigest()[:16] + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                self.state.record(query, 304)
+                self.send_body(304, "", None, headers)
+                return
+
+        self.state.record(query, 200)
+        self.send_body(200, html, "text/html", headers)
+
+    def send_body(self, status, body, content_type, headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(data)
+
+
+def generate_self_signed_cert(directory):
+    """Create a throwaway certificate for www.youtube.com with the openssl CLI."""
+    certfile = Path(directory) / "standin.crt"
+    keyfile = Path(directory) / "standin.key"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=www.youtube.com",
+            "-addext", "subjectAltName=DNS:www.youtube.com,DNS:youtube.com",
+            "-keyout", str(keyfile), "-out", str(certfile),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def start_server(scenario, host="127.0.0.1", port=0, tls=True, certfile=None, keyfile=None):
+    """Start the stand-in on a background thread; returns (server, state)."""
+    state = StandinState(scenario)
+    handler = type("BoundStandinHandler", (StandinHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+
+    if tls:
+        if not certfile:
+            certfile, keyfile = generate_self_signed_cert(tempfile.mkdtemp(prefix="standin-"))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", help="scenario JSON file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--no-tls", action="store_true", help="serve plain HTTP")
+    parser.add_argument("--certfile")
+    parser.add_argument("--keyfile")
+    args = parser.parse_args(argv)
+
+    server, _ = start_server(
+        load_scenario(args.scenario), args.host, args.port,
+        tls=not args.no_tls, certfile=args.certfile, keyfile=args.keyfile,
+    )
+    scheme = "http" if args.no_tls else "https"
+    print(f"YouTube stand-in listening on {scheme}://{args.host}:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+/**
+ * Fixture check and micro-benchmark for view-count-parser.js.
+ *
+ * Every fixture is parsed with its own locale and with 'auto'; mismatches
+ * are reported and make the process exit non-zero. The benchmark then
+ * replays the fixture strings as repeated result pages, cold (memo cleared
+ * each page) and warm, through the batch API.
+ *
+ * Usage: node tools/view-count-bench.js [iterations]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const root = path.resolve(__dirname, '..');
+const source = fs.readFileSync(path.join(root, 'view-count-parser.js'), 'utf8');
+const ViewCountParser = vm.runInNewContext(`${source}\nViewCountParser`, {});
+const fixtures = JSON.parse(fs.readFileSync(path.join(__dirname, 'fixtures', 'view_counts.json'), 'utf8'));
+
+let failures = 0;
+for (const { locale, text, expected } of fixtures) {
+    for (const mode of [locale, 'auto']) {
+        const actual = ViewCountParser.parse(text, mode);
+        if (actual !== expected) {
+            failures++;
+            console.log(`FAIL [${mode}] ${JSON.stringify(text)}: expected ${expected}, got ${actual}`);
+        }
+    }
+}
+console.log(`${fixtures.length * 2 - failures}/${fixtures.length * 2} fixture checks passed`);
+
+const iterations = parseInt(process.argv[2], 10) || 2000;
+const page = fixtures.map(fixture => fixture.text);
+
+function bench(label, beforePage) {
+    const started = process.hrtime.bigint();
+    for (let i = 0; i < iterations; i++) {
+        beforePage();
+        ViewCountParser.parseMany(page);
+    }
+    const elapsedNs = Number(process.hrtime.bigint() - started);
+    const perString = elapsedNs / (iterations * page.length);
+    console.log(`${label.padEnd(6)} ${(elapsedNs / 1e6).toFixed(1)}ms total, ${perString.toFixed(0)}ns per string`);
+}
+
+bench('cold', () => ViewCountParser.clearMemo());
+bench('warm', () => {});
+
+process.exit(failures ? 1 : 0);